@@ -0,0 +1,27 @@
+"""
+Benchmarks of the hot paths, run with ``pytest benchmarks`` (or
+``tox -e benchmark``) and the ``benchmark`` extra installed.
+"""
+
+import random
+
+import pytest
+
+
+def generate_tags(count, non_version_ratio):
+    """
+    Generate count tags, of which non_version_ratio are not versions.
+    """
+    rand = random.Random(count)
+    non_versions = ['tip', 'deploy-prod', 'backup/2023-01', 'release-candidate']
+    return [
+        rand.choice(non_versions) + f'-{n}'
+        if rand.random() < non_version_ratio
+        else f'{n // 100}.{n // 10 % 10}.{n % 10}'
+        for n in range(count)
+    ]
+
+
+@pytest.fixture
+def synthetic_tags():
+    return generate_tags
@@ -0,0 +1,61 @@
+"""
+Benchmarks for version arithmetic and inference.
+"""
+
+import pytest
+
+from jaraco import versioning
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.mark.benchmark(group='arithmetic')
+def test_add(benchmark):
+    left = versioning.SummableVersion('3.1.2')
+    right = versioning.SummableVersion('0.0.1')
+    benchmark(lambda: left + right)
+
+
+@pytest.mark.benchmark(group='arithmetic')
+def test_reset_less_significant(benchmark):
+    significant = versioning.SummableVersion('0.1')
+
+    def setup():
+        # reset in place, so each round needs a fresh version
+        return (versioning.SummableVersion('3.1.2'), significant), {}
+
+    benchmark.pedantic(
+        versioning.SummableVersion.reset_less_significant, setup=setup, rounds=10_000
+    )
+
+
+@pytest.mark.benchmark(group='arithmetic')
+def test_as_number(benchmark):
+    benchmark(versioning.SummableVersion('1.9.3').as_number)
+
+
+@pytest.mark.benchmark(group='inference')
+def test_semver(benchmark):
+    benchmark(versioning.semver, '1.2')
+
+
+@pytest.mark.benchmark(group='inference')
+@pytest.mark.parametrize('last', ['3.1.2', '3.1a1'])
+def test_infer_next_version(benchmark, last):
+    benchmark(versioning.Versioned.infer_next_version, last, 'minor')
+
+
+@pytest.mark.benchmark(group='compare')
+@pytest.mark.parametrize('keyed', [False, True])
+def test_max(benchmark, synthetic_tags, keyed):
+    versions = list(
+        filter(None, map(versioning.parse_cache.lookup, synthetic_tags(10_000, 0)))
+    )
+    if keyed:
+        versions = list(map(versioning.sort_key, versions))
+    benchmark(max, versions)
+
+
+@pytest.mark.benchmark(group='compare')
+def test_sort_key(benchmark):
+    benchmark(versioning.sort_key, versioning.parse('1.2.3rc1.post2.dev3+local.1'))
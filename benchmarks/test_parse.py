@@ -0,0 +1,50 @@
+"""
+Benchmarks for parsing tags into versions.
+"""
+
+import collections
+import types
+
+import pytest
+
+from jaraco import versioning
+
+pytest.importorskip('pytest_benchmark')
+
+Tag = collections.namedtuple('Tag', 'tag')
+
+
+class Repo(versioning.Versioned, types.SimpleNamespace):
+    pass
+
+
+@pytest.fixture(params=[False, True], ids=['unfiltered', 'prefiltered'])
+def prefilter(request, monkeypatch):
+    """
+    Whether tags are prefiltered; when not, every tag is parsed.
+    """
+    if not request.param:
+        monkeypatch.setattr(versioning, 'might_be_version', lambda text: True)
+    return request.param
+
+
+@pytest.mark.benchmark(group='prefilter')
+def test_lookup_mostly_non_versions(benchmark, synthetic_tags, prefilter):
+    tags = synthetic_tags(10_000, non_version_ratio=0.9)
+    lookup = versioning.parse_cache.lookup
+    benchmark.pedantic(
+        lambda: sum(1 for tag in tags if lookup(tag) is not None),
+        setup=versioning.parse_cache.clear,
+        rounds=20,
+    )
+
+
+@pytest.mark.benchmark(group='prefilter')
+def test_valid_versions_mostly_non_versions(benchmark, synthetic_tags, prefilter):
+    tags = list(map(Tag, synthetic_tags(10_000, non_version_ratio=0.9)))
+    repo = Repo(get_repo_tags=lambda: tags)
+    benchmark.pedantic(
+        lambda: sum(1 for _ in repo.get_valid_versions()),
+        setup=versioning.parse_cache.clear,
+        rounds=20,
+    )
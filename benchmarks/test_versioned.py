@@ -0,0 +1,31 @@
+"""
+Benchmarks for resolving the latest version from repo tags.
+"""
+
+import collections
+import types
+
+import pytest
+
+from jaraco import versioning
+
+pytest.importorskip('pytest_benchmark')
+
+Tag = collections.namedtuple('Tag', 'tag')
+
+
+class Repo(versioning.Versioned, types.SimpleNamespace):
+    pass
+
+
+@pytest.mark.benchmark(group='latest')
+@pytest.mark.parametrize('non_version_ratio', [0, 0.5, 0.9])
+@pytest.mark.parametrize('count', [10, 1_000, 100_000, 1_000_000])
+def test_get_latest_version(benchmark, synthetic_tags, count, non_version_ratio):
+    tags = list(map(Tag, synthetic_tags(count, non_version_ratio)))
+    repo = Repo(get_repo_tags=lambda: tags)
+    benchmark.pedantic(
+        repo.get_latest_version,
+        setup=versioning.parse_cache.clear,
+        rounds=max(3, 100_000 // count),
+    )
@@ -0,0 +1,6 @@
+import importlib.util
+
+collect_ignore = []
+
+if not importlib.util.find_spec('numpy'):
+    collect_ignore.append('jaraco/versioning/array.py')
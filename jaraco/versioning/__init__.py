@@ -0,0 +1,1172 @@
+"""
+More sophisticated version manipulation (than packaging).
+
+packaging is imported only when first needed, keeping this module
+cheap to import for short-lived processes.
+"""
+
+import bisect
+import collections
+import contextlib
+import functools
+import heapq
+import itertools
+import threading
+import time
+
+
+def find(pred, items):
+    """
+    Find the index of the first element in items for which pred returns
+    True
+
+    >>> find(lambda x: x > 3, range(100))
+    4
+    >>> find(lambda x: x < -3, range(100)) is None
+    True
+    """
+    for i, item in enumerate(items):
+        if pred(item):
+            return i
+
+
+def rfind(pred, items):
+    """
+    Find the index of the last element in items for which pred returns
+    True. Returns a negative number useful for indexing from the end
+    of a list or tuple.
+
+    >>> rfind(lambda x: x > 3, [5,4,3,2,1])
+    -4
+    """
+    return -find(pred, reversed(items)) - 1
+
+
+def __getattr__(name):
+    if name == 'SummableVersion':
+        from .summable import SummableVersion
+
+        return SummableVersion
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.cache
+def _version_class():
+    from packaging.version import Version
+
+    return Version
+
+
+_candidate_pattern = r'v?\d[\w.!+-]*'
+"""
+The text of anything that might be a version (matched ignoring case).
+"""
+
+
+@functools.cache
+def _candidate():
+    import re
+
+    return re.compile(rf'\s*{_candidate_pattern}\s*', re.IGNORECASE)
+
+
+def might_be_version(text):
+    """
+    Cheaply reject text that cannot be a version (lacking a leading
+    digit or containing characters never found in a version). Text that
+    passes is not necessarily a valid version.
+
+    >>> might_be_version('v1.0')
+    True
+    >>> might_be_version('1.0-foo')
+    True
+    >>> might_be_version('tip')
+    False
+    >>> might_be_version('backup/2023-01')
+    False
+    """
+    return _candidate().fullmatch(text) is not None
+
+
+CacheInfo = collections.namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+
+class ParseCache:
+    """
+    A size-bounded cache of parsed versions.
+
+    Text that cannot be parsed is cached too (as None), so repeated
+    encounters with non-version tags don't repeatedly raise. Text that
+    is obviously not a version is rejected without consulting the cache.
+
+    >>> cache = ParseCache(maxsize=2)
+    >>> cache.lookup('1.0')
+    <Version('1.0')>
+    >>> cache.lookup('1.x') is None
+    True
+    >>> cache.lookup('foo') is None
+    True
+    >>> cache.lookup('1.0')
+    <Version('1.0')>
+    >>> cache.info()
+    CacheInfo(hits=1, misses=2, maxsize=2, currsize=2)
+
+    Once full, the least recently used entry is evicted to make room.
+    The default capacity comfortably holds the tags of large repos, so
+    repeated scans don't evict entries before their reuse.
+
+    >>> cache.lookup('2.0')
+    <Version('2.0')>
+    >>> cache.lookup('1.x') is None
+    True
+    >>> cache.info()
+    CacheInfo(hits=1, misses=4, maxsize=2, currsize=2)
+
+    Parsed versions are shared between callers, so must not be mutated.
+    """
+
+    def __init__(self, maxsize=2**18):
+        self._entries = collections.OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    @property
+    def maxsize(self):
+        """
+        The capacity of the cache. Reducing it evicts the least
+        recently used entries as needed.
+
+        >>> cache = ParseCache()
+        >>> _ = list(map(cache.lookup, ['1', '2', '3']))
+        >>> cache.maxsize = 1
+        >>> cache.info()
+        CacheInfo(hits=0, misses=3, maxsize=1, currsize=1)
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value):
+        with self._lock:
+            self._maxsize = value
+            self._trim()
+
+    def _trim(self):
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def lookup(self, text, cls=None):
+        """
+        Return text parsed as cls (default packaging's Version) or
+        None if it's not a valid version.
+        """
+        if not might_be_version(text):
+            return None
+        key = text, cls
+        with self._lock:
+            try:
+                result = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return result
+        try:
+            result = (cls or _version_class())(text)
+        except ValueError:
+            result = None
+        with self._lock:
+            self._entries[key] = result
+            self._trim()
+        return result
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self._maxsize, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+parse_cache = ParseCache()
+"""
+The cache through which :class:`Versioned` and the helpers in this
+module parse versions. Adjust ``parse_cache.maxsize`` to suit the
+number of tags in play.
+"""
+
+
+def parse(text, cls=None):
+    """
+    Parse text as a version of cls (through the cache), raising
+    InvalidVersion if it's not a valid version.
+
+    >>> parse('1.0')
+    <Version('1.0')>
+    >>> parse('foo')
+    Traceback (most recent call last):
+    ...
+    packaging.version.InvalidVersion: Invalid version: 'foo'
+    """
+    result = parse_cache.lookup(text, cls)
+    if result is None:
+        from packaging.version import InvalidVersion
+
+        raise InvalidVersion(f"Invalid version: {text!r}")
+    return result
+
+
+def semver(orig):
+    """
+    >>> semver('1')
+    'v1.0.0'
+    >>> semver('1.2')
+    'v1.2.0'
+    >>> semver('10.11.12')
+    'v10.11.12'
+    >>> semver('v1.0')
+    'v1.0.0'
+    """
+    from .summable import SummableVersion
+
+    ver = parse(str(orig), SummableVersion) + parse('0.0.0')
+    return f'v{ver}'
+
+
+def _add_releases(release, other):
+    return tuple(
+        left + right
+        for left, right in itertools.zip_longest(release, other, fillvalue=0)
+    )
+
+
+def _reset_release(release, significant):
+    def nonzero(x):
+        return x != 0
+
+    version_len = len(significant)
+    significant_pos = version_len + rfind(nonzero, significant) + 1
+    return release[:significant_pos] + (0,) * (version_len - significant_pos)
+
+
+def _as_number(release):
+    def combine(subver, ver):
+        return subver / 10 + ver
+
+    return functools.reduce(combine, reversed(release))
+
+
+def _summable(version):
+    """
+    Return version (a Version or text) as a SummableVersion.
+    """
+    from .summable import SummableVersion
+
+    if isinstance(version, SummableVersion):
+        return version
+    if isinstance(version, _version_class()):
+        return SummableVersion.from_parts(
+            epoch=version.epoch,
+            release=version.release,
+            pre=version.pre,
+            post=version.post,
+            dev=version.dev,
+            local=version.local,
+        )
+    return parse(str(version), SummableVersion)
+
+
+def _parts(version):
+    """
+    Return the components of version, suitable for serialization.
+    """
+    return (
+        version.epoch,
+        version.release,
+        version.pre,
+        version.post,
+        version.dev,
+        version.local,
+    )
+
+
+def _from_parts(parts):
+    """
+    Construct a Version from parts, as returned by :func:`_parts`
+    (possibly with lists in place of tuples).
+
+    >>> _from_parts(list(_parts(parse('1!2.3rc4.post5.dev6+abc'))))
+    <Version('1!2.3rc4.post5.dev6+abc')>
+    """
+    epoch, release, pre, post, dev, local = parts
+    return _version_class().from_parts(
+        epoch=epoch,
+        release=tuple(release),
+        pre=pre and tuple(pre),
+        post=post,
+        dev=dev,
+        local=local,
+    )
+
+
+def _as_version(version):
+    if isinstance(version, _version_class()):
+        return version
+    return parse(str(version))
+
+
+def _series(series):
+    """
+    Resolve series as a tuple of release components.
+
+    >>> _series('2.3')
+    (2, 3)
+    >>> _series((2,))
+    (2,)
+    """
+    if isinstance(series, str):
+        return tuple(map(int, series.split('.')))
+    return tuple(series)
+
+
+def _in_series(version, prefix):
+    """
+    >>> _in_series(parse('2.3.1'), (2, 3))
+    True
+    >>> _in_series(parse('2'), (2, 0))
+    True
+    >>> _in_series(parse('2.30'), (2, 3))
+    False
+    """
+    head = version.release[: len(prefix)]
+    return head + (0,) * (len(prefix) - len(head)) == prefix
+
+
+def _uint(number):
+    data = number.to_bytes((number.bit_length() + 7) // 8, 'big')
+    return bytes((len(data),)) + data
+
+
+_phases = ('a', 'b', 'rc')
+"""
+The pre-release phases, in order.
+"""
+
+
+def _phase_rank(pre, post, dev):
+    """
+    Rank the pre-release phase of a version with segments pre, post
+    and dev (as on a Version): a development release (without pre- or
+    post-release) first, then each of :data:`_phases`, then the rest.
+
+    >>> [_phase_rank(None, None, 0), _phase_rank(('a', 1), None, 0)]
+    [0, 1]
+    >>> [_phase_rank(('rc', 1), None, None), _phase_rank(None, 1, 0)]
+    [3, 4]
+    """
+    if pre is not None:
+        return _phases.index(pre[0]) + 1
+    if post is None and dev is not None:
+        return 0
+    return len(_phases) + 1
+
+
+def _local_segments(local):
+    """
+    Return the segments of the local label (if any) as (rank, value)
+    pairs, ordered as PEP 440 prescribes: text (rank 0) before numbers
+    (rank 1), text lexicographically and numbers numerically.
+
+    >>> _local_segments('Ubuntu-1')
+    ((0, 'ubuntu'), (1, 1))
+    >>> _local_segments(None) < _local_segments('abc') < _local_segments('abc.1')
+    True
+    >>> _local_segments('abc.1') < _local_segments('1')
+    True
+    """
+    if local is None:
+        return ()
+    return tuple(
+        (1, int(part)) if part.isdigit() else (0, part.lower())
+        for part in local.replace('-', '.').replace('_', '.').split('.')
+    )
+
+
+def sort_key(version):
+    """
+    Return bytes that order as version does under PEP 440, so
+    versions may be sorted and searched by plain bytes comparison.
+    Equal versions have equal keys.
+
+    >>> sort_key(parse('1.0')) == sort_key(parse('1.0.0'))
+    True
+    >>> versions = ['1.0+local', '1.0', '1.0.post1', '1.0a1', '1.0.dev0', '0.9', '1!0.1']
+    >>> [str(v) for v in sorted(map(parse, versions), key=sort_key)]
+    ['0.9', '1.0.dev0', '1.0a1', '1.0', '1.0+local', '1.0.post1', '1!0.1']
+
+    Each number is encoded as its length followed by its big-endian
+    bytes, and each field is self-delimiting, so keys of any length
+    compare field by field.
+
+    Computing a key costs more than comparing two versions, so keys
+    pay off where they're computed once and compared many times, such
+    as when stored alongside the versions.
+    """
+    release = version.release
+    end = len(release)
+    while end and not release[end - 1]:
+        end -= 1
+    parts = [_uint(version.epoch)]
+    parts.extend(b'\x01' + _uint(number) for number in release[:end])
+    parts.append(b'\x00')
+    pre, post, dev = version.pre, version.post, version.dev
+    parts.append(bytes((_phase_rank(pre, post, dev),)) + _uint(pre[1] if pre else 0))
+    parts.append(b'\x00' if post is None else b'\x01' + _uint(post))
+    parts.append(b'\x01' if dev is None else b'\x00' + _uint(dev))
+    parts.extend(
+        b'\x02' + _uint(value) if rank else b'\x01' + value.encode('ascii') + b'\x00'
+        for rank, value in _local_segments(version.local)
+    )
+    return b''.join(parts)
+
+
+class VersionSet:
+    """
+    Distinct versions held in order, answering queries about the
+    neighbours of a version by bisection.
+
+    >>> versions = VersionSet(map(parse, ['1.0', '1.1', '2.0', '1.1.0']))
+    >>> len(versions)
+    3
+    >>> versions.floor('1.5'), versions.ceiling('1.5')
+    (<Version('1.1')>, <Version('2.0')>)
+    >>> versions.floor('1.1'), versions.latest_before('1.1')
+    (<Version('1.1')>, <Version('1.0')>)
+    >>> versions.successor('1.1'), versions.successor('2.0')
+    (<Version('2.0')>, None)
+    >>> versions.latest_before('1.0') is None
+    True
+    >>> versions.contains('1.1.0'), '1.2' in versions
+    (True, False)
+    """
+
+    def __init__(self, versions=()):
+        self._versions = sorted(set(versions))
+
+    def _at(self, index):
+        return self._versions[index] if 0 <= index < len(self._versions) else None
+
+    def floor(self, version):
+        """
+        Return the latest version no later than version, or None.
+        """
+        return self._at(bisect.bisect_right(self._versions, _as_version(version)) - 1)
+
+    def ceiling(self, version):
+        """
+        Return the earliest version no earlier than version, or None.
+        """
+        return self._at(bisect.bisect_left(self._versions, _as_version(version)))
+
+    def successor(self, version):
+        """
+        Return the earliest version later than version, or None.
+        """
+        return self._at(bisect.bisect_right(self._versions, _as_version(version)))
+
+    def latest_before(self, version):
+        """
+        Return the latest version earlier than version, or None.
+        """
+        return self._at(bisect.bisect_left(self._versions, _as_version(version)) - 1)
+
+    def contains(self, version):
+        version = _as_version(version)
+        return self._at(bisect.bisect_left(self._versions, version)) == version
+
+    __contains__ = contains
+
+    def latest_in_series(self, series):
+        """
+        Return the latest version whose release begins with series
+        (such as '2.3' or (2, 3)), or None, bisecting within each epoch.
+
+        >>> versions = VersionSet(map(parse, ['2.3.1', '2.3.10', '2.30', '1!2.2']))
+        >>> versions.latest_in_series('2.3'), versions.latest_in_series('2.2')
+        (<Version('2.3.10')>, <Version('1!2.2')>)
+        >>> versions.latest_in_series('2.4') is None
+        True
+        """
+        prefix = _series(series)
+        after = '.'.join(map(str, prefix[:-1] + (prefix[-1] + 1,)))
+        end = len(self._versions)
+        while end:
+            epoch = self._versions[end - 1].epoch
+            # the earliest versions after the series and in the epoch
+            bound = parse(f'{epoch}!{after}.dev0')
+            start = parse(f'{epoch}!0.dev0')
+            found = self._at(bisect.bisect_left(self._versions, bound, 0, end) - 1)
+            if found is not None and found.epoch == epoch and _in_series(found, prefix):
+                return found
+            end = bisect.bisect_left(self._versions, start, 0, end)
+        return None
+
+    @property
+    def latest(self):
+        return self._versions[-1] if self._versions else None
+
+    def latest_versions(self, k):
+        """
+        Return the k latest versions, latest first.
+
+        >>> VersionSet(map(parse, ['1.0', '2.0', '3.0'])).latest_versions(2)
+        [<Version('3.0')>, <Version('2.0')>]
+        """
+        return self._versions[max(len(self._versions) - k, 0) :][::-1]
+
+    def between(self, lo=None, hi=None):
+        """
+        Return the versions at least lo and less than hi (either of
+        which may be None for no bound), in order.
+
+        >>> VersionSet(map(parse, ['1.0', '2.0', '3.0'])).between('1.5')
+        [<Version('2.0')>, <Version('3.0')>]
+        """
+        start = 0 if lo is None else bisect.bisect_left(self._versions, _as_version(lo))
+        stop = (
+            len(self._versions)
+            if hi is None
+            else bisect.bisect_left(self._versions, _as_version(hi))
+        )
+        return self._versions[start:stop]
+
+    def __iter__(self):
+        return iter(self._versions)
+
+    def __len__(self):
+        return len(self._versions)
+
+
+class VersionIndex(VersionSet):
+    """
+    A :class:`VersionSet` of the versions represented by a set of tags,
+    maintained incrementally as tags are added and removed.
+
+    >>> index = VersionIndex(['foo', '1.0', '2.0'])
+    >>> index.latest
+    <Version('2.0')>
+    >>> index.add_tags(['3.0', 'v3.0'])
+    >>> index.remove_tags(['3.0'])
+    >>> index.latest
+    <Version('3.0')>
+    >>> index.remove_tags(['v3.0', 'foo'])
+    >>> list(map(str, index))
+    ['1.0', '2.0']
+    >>> len(index)
+    2
+
+    >>> VersionIndex().latest is None
+    True
+    """
+
+    def __init__(self, tags=()):
+        self._versions = []
+        self._tags = {}
+        self._counts = collections.Counter()
+        self.add_tags(tags)
+
+    def add_tags(self, tags):
+        lookup = parse_cache.lookup
+        for tag in tags:
+            version = lookup(tag)
+            if version is None or tag in self._tags:
+                continue
+            self._tags[tag] = version
+            self._counts[version] += 1
+            if self._counts[version] == 1:
+                bisect.insort(self._versions, version)
+
+    def remove_tags(self, tags):
+        for tag in tags:
+            version = self._tags.pop(tag, None)
+            if version is None:
+                continue
+            self._counts[version] -= 1
+            if not self._counts[version]:
+                del self._counts[version]
+                del self._versions[bisect.bisect_left(self._versions, version)]
+
+
+class SeriesHeads(dict):
+    """
+    The latest version in each release series (the release truncated
+    or padded with zeros to depth components), maintained as versions
+    are added.
+
+    >>> heads = SeriesHeads(2, map(parse, ['1.0', '1.0.3', '2', '2.1rc1']))
+    >>> heads
+    {(1, 0): <Version('1.0.3')>, (2, 0): <Version('2')>, (2, 1): <Version('2.1rc1')>}
+    >>> heads.add_tags(['2.1', 'foo', '1.1'])
+    >>> heads[2, 1], heads[1, 1]
+    (<Version('2.1')>, <Version('1.1')>)
+    """
+
+    def __init__(self, depth=2, versions=()):
+        super().__init__()
+        self.depth = depth
+        self.add_versions(versions)
+
+    def key(self, version):
+        """
+        Return the series of version.
+        """
+        head = version.release[: self.depth]
+        return head + (0,) * (self.depth - len(head))
+
+    def add(self, version):
+        key = self.key(version)
+        head = self.get(key)
+        if head is None or version > head:
+            self[key] = version
+
+    def add_versions(self, versions):
+        for version in versions:
+            self.add(version)
+
+    def add_tags(self, tags):
+        self.add_versions(filter(None, map(parse_cache.lookup, tags)))
+
+
+class Timings:
+    """
+    An observer of version resolution (see :attr:`Versioned.observer`)
+    recording the count and cumulative duration of each stage: the
+    hooks (get_tags, is_modified, get_parent_tags, get_repo_tags),
+    parse, select and infer. It also tallies the tags seen and
+    rejected (as not versions) by parse.
+
+    >>> timings = Timings()
+    >>> with timings.stage('parse'):
+    ...     timings.tally('tags', 3)
+    >>> timings.counts
+    Counter({'parse': 1})
+    >>> timings.tallies
+    Counter({'tags': 3})
+    >>> timings.durations['parse'] >= 0
+    True
+    """
+
+    def __init__(self):
+        self.counts = collections.Counter()
+        self.durations = collections.defaultdict(float)
+        self.tallies = collections.Counter()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] += time.perf_counter() - start
+            self.counts[name] += 1
+
+    def tally(self, name, count):
+        self.tallies[name] += count
+
+
+class Snapshot:
+    """
+    The state of a repo as seen by one version resolution. Each
+    hook of the repo (get_tags, is_modified, get_parent_tags and
+    get_repo_tags) is queried at most once and its result retained.
+
+    Pass one as ``snapshot`` to the queries on :class:`Versioned` to
+    share the results between them.
+    """
+
+    def __init__(self, repo):
+        self.repo = repo
+        self._results = {}
+
+    def _query(self, name, *args):
+        key = (name,) + args
+        try:
+            return self._results[key]
+        except KeyError:
+            pass
+        observer = self.repo.observer
+        if observer is None:
+            result = self._run(name, *args)
+        else:
+            with observer.stage(name):
+                result = self._run(name, *args)
+        self._results[key] = result
+        return result
+
+    def _run(self, name, *args):
+        result = getattr(self.repo, name)(*args)
+        return result if name == 'is_modified' else list(result)
+
+    def get_tags(self):
+        return self._query('get_tags')
+
+    def is_modified(self):
+        return self._query('is_modified')
+
+    def get_parent_tags(self, rev):
+        return self._query('get_parent_tags', rev)
+
+    def get_repo_tags(self):
+        return self._query('get_repo_tags')
+
+
+def _hashable(value):
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _memoized(method):
+    """
+    Retain the results of method (called without a snapshot) on the
+    instance for as long as its state token is unchanged, however the
+    arguments are passed.
+    """
+
+    @functools.cache
+    def signature():
+        import inspect
+
+        return inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature().bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        params = dict(bound.arguments)
+        del params['self']
+        key = method.__name__, tuple(params.items())
+        if params.get('snapshot') is not None or not _hashable(key):
+            return method(self, *args, **kwargs)
+        token = self.get_state_token()
+        if token is None:
+            return method(self, *args, **kwargs)
+        token_, results = self.__dict__.get('_version_memo', (None, None))
+        if results is None or token_ != token:
+            token_, results = self.__dict__['_version_memo'] = token, {}
+        if key not in results:
+            results[key] = method(self, *args, **kwargs)
+        return results[key]
+
+    return wrapper
+
+
+@functools.cache
+def _accepts(func, name):
+    """
+    Does func accept a keyword argument of name?
+    """
+    import inspect
+
+    params = inspect.signature(func).parameters.values()
+    return any(
+        param.name == name or param.kind is param.VAR_KEYWORD for param in params
+    )
+
+
+class Versioned:
+    """
+    Version functionality mix-ins for jaraco.vcs.Repo classes.
+    """
+
+    increment = 'patch'
+    semantic_increment = dict(
+        major='1',
+        minor='0.1',
+        patch='0.0.1',
+    )
+
+    version_index = None
+    """
+    An optional :class:`VersionIndex` of the repo tags. When set,
+    the valid and latest versions are answered from the index (which
+    the subclass keeps current) instead of rescanning the repo tags.
+    """
+
+    version_store = None
+    """
+    An optional :class:`jaraco.versioning.store.VersionStore` retaining
+    the versions parsed from the repo tags across processes.
+    """
+
+    parallel_threshold = None
+    """
+    The number of repo tags above which they are parsed across a pool
+    of processes (see :mod:`jaraco.versioning.parallel`), or None to
+    always parse them in this process.
+    """
+
+    observer = None
+    """
+    An optional observer of version resolution, such as
+    :class:`Timings`, or None for no observation (and no overhead).
+    """
+
+    @staticmethod
+    def __versions_from_tags(tags):
+        lookup = parse_cache.lookup
+        for tag in tags:
+            version = lookup(tag)
+            if version is not None:
+                yield version
+
+    @staticmethod
+    def __best_version(versions):
+        try:
+            return max(versions)
+        except ValueError:
+            pass
+
+    def __stage(self, name, func, *args):
+        observer = self.observer
+        if observer is None:
+            return func(*args)
+        with observer.stage(name):
+            return func(*args)
+
+    def __parse(self, tags, parse):
+        observer = self.observer
+        if observer is None:
+            return parse(tags)
+        tags = list(tags)
+        with observer.stage('parse'):
+            versions = list(parse(tags))
+        observer.tally('tags', len(tags))
+        observer.tally('rejected', len(tags) - len(versions))
+        return versions
+
+    def __select(self, versions):
+        return self.__stage('select', self.__best_version, versions)
+
+    def get_state_token(self):
+        """
+        Return a cheap, hashable token of the repo state (such as the
+        hash of HEAD, the modification time of the tags and whether the
+        working set is modified) that changes whenever the tagged,
+        latest or current version might. While it's unchanged, those
+        versions are answered from the results retained on the
+        instance. The default, None, retains nothing.
+        """
+
+    def __with_snapshot(self, name, snapshot, *args, **kwargs):
+        """
+        Call the method of name, sharing snapshot unless a subclass
+        overrides the method without accepting one.
+        """
+        if _accepts(getattr(type(self), name), 'snapshot'):
+            kwargs.update(snapshot=snapshot)
+        return getattr(self, name)(*args, **kwargs)
+
+    def snapshot(self):
+        """
+        Return a :class:`Snapshot` of this repo, to share between queries.
+        """
+        return Snapshot(self)
+
+    def _snapshot(self, snapshot):
+        """
+        Resolve the snapshot through which to query the repo: the
+        one given, a new one when observing (so the queries are
+        observed), or None to query the repo directly.
+        """
+        if snapshot is None and self.observer is not None:
+            return self.snapshot()
+        return snapshot
+
+    def __parse_repo_tags(self, tags):
+        if self.version_store is not None:
+            return iter(self.version_store.versions(tags))
+        if self.parallel_threshold is not None:
+            tags = list(tags)
+            if len(tags) > self.parallel_threshold:
+                from . import parallel
+
+                return iter(parallel.parse_versions(tags))
+        return self.__versions_from_tags(tags)
+
+    def get_valid_versions(self, snapshot=None):
+        """
+        Return all version tags that can be represented by a Version.
+        """
+        if self.version_index is not None:
+            return iter(self.version_index)
+        snapshot = self._snapshot(snapshot)
+        tags = (tag.tag for tag in (snapshot or self).get_repo_tags())
+        return iter(self.__parse(tags, self.__parse_repo_tags))
+
+    @_memoized
+    def get_tagged_version(self, snapshot=None):
+        """
+        Get the version of the local working set as a Version or
+        None if no viable tag exists. If the local working set is itself
+        the tagged commit and the tip and there are no local
+        modifications, use the tag on the parent changeset.
+        """
+        source = self._snapshot(snapshot) or self
+        tags = list(source.get_tags())
+        if 'tip' in tags and not source.is_modified():
+            tags = source.get_parent_tags('tip')
+        return self.__select(self.__parse(tags, self.__versions_from_tags))
+
+    @_memoized
+    def get_latest_version(self, snapshot=None):
+        """
+        Determine the latest version ever released of the project in
+        the repo (based on tags).
+        """
+        if self.version_index is not None:
+            return self.version_index.latest
+        snapshot = self._snapshot(snapshot)
+        if self.parallel_threshold is not None and self.version_store is None:
+            tags = [tag.tag for tag in (snapshot or self).get_repo_tags()]
+            if len(tags) > self.parallel_threshold:
+                from . import parallel
+
+                return self.__stage('parse', parallel.latest_version, tags)
+            return self.__select(self.__parse(tags, self.__versions_from_tags))
+        return self.__select(self.__with_snapshot('get_valid_versions', snapshot))
+
+    def get_version_set(self, snapshot=None):
+        """
+        Return a :class:`VersionSet` of the valid versions, to answer
+        many queries about them (such as the release preceding each
+        tag) without rescanning the tags.
+        """
+        if self.version_index is not None:
+            return self.version_index
+        return VersionSet(self.__with_snapshot('get_valid_versions', snapshot))
+
+    def get_latest_versions(self, k, snapshot=None):
+        """
+        Return the k latest versions, latest first.
+        """
+        if self.version_index is not None:
+            return self.version_index.latest_versions(k)
+        return heapq.nlargest(k, self.__with_snapshot('get_valid_versions', snapshot))
+
+    def get_latest_in_series(self, series, snapshot=None):
+        """
+        Return the latest version whose release begins with series
+        (such as '2.3' or (2, 3)), or None if there is none. With a
+        :attr:`version_index`, the version is found by bisection.
+        """
+        if self.version_index is not None:
+            return self.version_index.latest_in_series(series)
+        prefix = _series(series)
+        return self.__best_version(
+            version
+            for version in self.__with_snapshot('get_valid_versions', snapshot)
+            if _in_series(version, prefix)
+        )
+
+    def get_series_heads(self, depth=2, snapshot=None):
+        """
+        Return a :class:`SeriesHeads` of the latest version in each
+        release series of depth components (such as (2, 3) for 2.3.x),
+        in a single pass over the valid versions.
+        """
+        return SeriesHeads(depth, self.__with_snapshot('get_valid_versions', snapshot))
+
+    def iter_versions_between(self, lo=None, hi=None, snapshot=None):
+        """
+        Yield the versions at least lo and less than hi (either of
+        which may be None for no bound), in the order of the tags, or
+        with a :attr:`version_index`, in order (found by bisection).
+        """
+        if self.version_index is not None:
+            return iter(self.version_index.between(lo, hi))
+        lo = lo if lo is None else _as_version(lo)
+        hi = hi if hi is None else _as_version(hi)
+        return (
+            version
+            for version in self.__with_snapshot('get_valid_versions', snapshot)
+            if (lo is None or version >= lo) and (hi is None or version < hi)
+        )
+
+    @_memoized
+    def get_current_version(self, increment=None, snapshot=None, series=None):
+        """
+        Return as a string the version of the current state of the
+        repository -- a tagged version, if present, or the next version
+        based on prior tagged releases (in series, if given).
+
+        The VCS is queried through snapshot, or a new one, so that
+        each hook is invoked at most once.
+        """
+        snapshot = snapshot or self.snapshot()
+        tagged = self.__with_snapshot('get_tagged_version', snapshot)
+        if tagged:
+            return str(tagged)
+        kwargs = {} if series is None else dict(series=series)
+        upcoming = self.__with_snapshot(
+            'get_next_version', snapshot, increment, **kwargs
+        )
+        return f'{upcoming}.dev0'
+
+    def get_next_version(self, increment=None, snapshot=None, series=None):
+        """
+        Return the next version based on prior tagged releases, or
+        if series is given (such as '2.3' for a maintenance branch),
+        on the latest release in that series. A series without
+        releases is itself the next version.
+        """
+        increment = increment or self.increment
+        if series is None:
+            latest = self.__with_snapshot('get_latest_version', snapshot)
+        else:
+            latest = self.__with_snapshot('get_latest_in_series', snapshot, series)
+            if latest is None:
+                return '.'.join(map(str, _series(series)))
+        return self.__stage('infer', self.infer_next_version, latest, increment)
+
+    @staticmethod
+    def infer_next_version(last_version, increment):
+        """
+        Given a simple application version (as a Version),
+        and an increment (1.0, 0.1, or 0.0.1), guess the next version.
+
+        Set up a shorthand for examples.
+
+        >>> def infer_next(*params):
+        ...     return str(Versioned.infer_next_version(*params))
+
+        >>> infer_next('3.2', '0.0.1')
+        '3.2.1'
+        >>> infer_next(parse('3.2'), '0.0.1')
+        '3.2.1'
+        >>> infer_next('3.2.3', '0.1')
+        '3.3'
+        >>> infer_next('3.1.2', '1.0')
+        '4.0'
+
+        A semantic identifier (major, minor, patch) may be used.
+
+        >>> infer_next('3.1.2', 'major')
+        '4'
+        >>> infer_next('3.1.2', 'minor')
+        '3.2'
+        >>> infer_next('3.1.2', 'patch')
+        '3.1.3'
+
+        Subversions never increment parent versions.
+
+        >>> infer_next('3.0.9', '0.0.1')
+        '3.0.10'
+
+        If it's a prerelease version, just remove the prerelease.
+
+        >>> infer_next('3.1a1', '0.0.1')
+        '3.1'
+
+        If there is no last version, use the increment itself
+
+        >>> infer_next(None, '0.1')
+        '0.1'
+        """
+        from .summable import SummableVersion
+
+        increment = Versioned.semantic_increment.get(increment, increment)
+        if last_version is None:
+            return increment
+        return Versioned._bump(
+            _summable(last_version), parse(increment, SummableVersion)
+        )
+
+    @staticmethod
+    def infer_next_versions(pairs):
+        """
+        Infer the next version for each of (last_version, increment)
+        pairs as :meth:`infer_next_version` does, yielding the results
+        in order. Each distinct increment is resolved and parsed once.
+
+        >>> pairs = [('3.2', 'patch'), (None, 'minor'), ('3.1a1', '0.0.1')]
+        >>> list(map(str, Versioned.infer_next_versions(pairs)))
+        ['3.2.1', '0.1', '3.1']
+        """
+        from .summable import SummableVersion
+
+        resolved = {}
+        parsed = {}
+        for last_version, increment in pairs:
+            if increment not in resolved:
+                resolved[increment] = Versioned.semantic_increment.get(
+                    increment, increment
+                )
+            if last_version is None:
+                yield resolved[increment]
+                continue
+            if increment not in parsed:
+                parsed[increment] = parse(resolved[increment], SummableVersion)
+            yield Versioned._bump(_summable(last_version), parsed[increment])
+
+    @staticmethod
+    def _bump(last_version, increment):
+        if last_version.is_prerelease:
+            return str(last_version.__replace__(pre=None, dev=None))
+        sum = last_version + increment
+        sum.reset_less_significant(increment)
+        return sum
+
+
+def _tag_names(lines):
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', errors='replace')
+        tag = line.strip()
+        if tag:
+            yield tag
+
+
+def versions_from_lines(lines):
+    """
+    Yield the versions among tags in lines, any iterable of text or
+    bytes (such as a file or the output of ``git tag``), one tag per
+    line. Lines are consumed as they're needed.
+
+    >>> list(versions_from_lines([b'1.0\\n', 'foo\\n', '', ' 2.0 ']))
+    [<Version('1.0')>, <Version('2.0')>]
+    """
+    lookup = parse_cache.lookup
+    return filter(None, map(lookup, _tag_names(lines)))
+
+
+def latest_version(lines):
+    """
+    Return the latest version among tags in lines (as for
+    :func:`versions_from_lines`) or None, in constant memory.
+
+    >>> import io
+    >>> latest_version(io.BytesIO(b'1.0\\ntip\\n1.1\\n'))
+    <Version('1.1')>
+    """
+    return max(versions_from_lines(lines), default=None)
+
+
+def next_version(lines, increment=Versioned.increment):
+    """
+    Return the next version after those tagged in lines (as for
+    :func:`versions_from_lines`), in constant memory.
+
+    >>> import io
+    >>> str(next_version(io.StringIO('1.0\\n1.1\\n'), 'minor'))
+    '1.2'
+    """
+    return Versioned.infer_next_version(latest_version(lines), increment)
+
+
+# for compatibility
+VersionManagement = Versioned
@@ -0,0 +1,118 @@
+"""
+Resolve versions from tags (one per line, such as the output of
+``git tag``) read from stdin or ``--tags FILE``::
+
+    git tag | python -m jaraco.versioning latest
+    git tag | python -m jaraco.versioning next --increment minor
+    git tag | python -m jaraco.versioning current --tagged "$(git tag --points-at)"
+    python -m jaraco.versioning semver 1.2
+
+With ``--serve PATH``, instead answer requests on a Unix socket at
+PATH, keeping parsed versions cached between requests. A request is
+a command line (such as ``next --increment minor``) followed by the
+tags, one per line; the response is a line with the result::
+
+    (echo latest; git tag) | nc -NU PATH
+"""
+
+import argparse
+import contextlib
+import errno
+import os
+import shlex
+import socketserver
+import stat
+import sys
+
+from . import Versioned, latest_version, next_version, semver
+
+
+class RequestParser(argparse.ArgumentParser):
+    """
+    A parser for requests to the server, raising rather than exiting.
+    """
+
+    def exit(self, status=0, message=None):
+        raise ValueError(message or status)
+
+    def error(self, message):
+        raise ValueError(message)
+
+
+def _parser(cls=argparse.ArgumentParser):
+    parser = cls(prog='python -m jaraco.versioning')
+    parser.add_argument('--tags', help="file of tags (default stdin)")
+    parser.add_argument('--serve', metavar='PATH', help="serve on a Unix socket")
+    commands = parser.add_subparsers(dest='command')
+    current = commands.add_parser('current', help="the current version")
+    current.add_argument('--tagged', nargs='*', default=[], help="working set tags")
+    current.add_argument('--increment')
+    next_ = commands.add_parser('next', help="the next version")
+    next_.add_argument('--increment')
+    commands.add_parser('latest', help="the latest version")
+    semver_ = commands.add_parser('semver', help="a version as a semantic version")
+    semver_.add_argument('version')
+    return parser
+
+
+def resolve(args, lines):
+    """
+    Return the result of the command in args for the tags in lines.
+    """
+    if args.command == 'semver':
+        return semver(args.version)
+    if args.command == 'latest':
+        return str(latest_version(lines) or '')
+    increment = args.increment or Versioned.increment
+    if args.command == 'current':
+        tagged = latest_version(' '.join(args.tagged).split())
+        if tagged:
+            return str(tagged)
+        return f'{next_version(lines, increment)}.dev0'
+    return str(next_version(lines, increment))
+
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        lines = (line.decode('utf-8') for line in self.rfile)
+        try:
+            args = _parser(RequestParser).parse_args(shlex.split(next(lines, '')))
+            result = resolve(args, lines)
+        except Exception as exc:  # noqa: BLE001 -- reported to the client
+            result = f'error: {exc}'
+        self.wfile.write(result.encode('utf-8') + b'\n')
+
+
+def make_server(path):
+    """
+    Return a server answering requests on a Unix socket at path,
+    replacing a stale socket there but nothing else.
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISSOCK(mode):
+            raise FileExistsError(errno.EEXIST, "Not a socket", path)
+        os.remove(path)
+    return socketserver.UnixStreamServer(path, Handler)
+
+
+def main(argv=None):
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.serve:
+        with make_server(args.serve) as server, contextlib.suppress(KeyboardInterrupt):
+            server.serve_forever()
+        return
+    if not args.command:
+        parser.error("a command is required")
+    if args.command == 'semver':
+        print(resolve(args, []))
+        return
+    with open(args.tags, encoding='utf-8') if args.tags else sys.stdin as lines:
+        print(resolve(args, lines))
+
+
+__name__ == '__main__' and main()
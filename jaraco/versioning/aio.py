@@ -0,0 +1,137 @@
+"""
+Version resolution for repos whose VCS queries are awaited.
+"""
+
+import asyncio
+import contextlib
+import inspect
+
+from . import Snapshot, Versioned
+
+
+def _forward(name):
+    return property(lambda self: getattr(self.repo, name))
+
+
+class _Resolver(Versioned):
+    """
+    Resolve versions as :class:`Versioned` does for an
+    :class:`AsyncVersioned` repo, from a snapshot already filled
+    with the results of its awaited hooks.
+    """
+
+    increment = _forward('increment')
+    version_index = _forward('version_index')
+    version_store = _forward('version_store')
+    parallel_threshold = _forward('parallel_threshold')
+    observer = _forward('observer')
+
+    def __init__(self, repo):
+        self.repo = repo
+
+    def infer_next_version(self, last_version, increment):
+        return self.repo.infer_next_version(last_version, increment)
+
+
+def _materialize(name, result):
+    return result if name == 'is_modified' else list(result)
+
+
+class AsyncVersioned:
+    """
+    Like :class:`jaraco.versioning.Versioned`, but the version queries
+    are coroutines.
+
+    The hooks (get_tags, get_parent_tags, get_repo_tags and is_modified)
+    may be coroutine functions. Other hooks are run in a worker thread
+    so as not to block the event loop. Independent hooks are queried
+    concurrently, then the versions are resolved by :class:`Versioned`
+    (parsing the tags in a worker thread too).
+    """
+
+    increment = Versioned.increment
+    version_index = None
+    version_store = None
+    parallel_threshold = Versioned.parallel_threshold
+    observer = Versioned.observer
+    infer_next_version = staticmethod(Versioned.infer_next_version)
+
+    async def _query(self, name, *args):
+        hook = getattr(self, name)
+        observer = self.observer
+        stage = contextlib.nullcontext() if observer is None else observer.stage(name)
+        with stage:
+            if inspect.iscoroutinefunction(hook):
+                return _materialize(name, await hook(*args))
+            return await asyncio.to_thread(lambda: _materialize(name, hook(*args)))
+
+    async def _snapshot(self, *names):
+        """
+        Query the named hooks concurrently (and the parent tags of
+        the tip, if the tagged version needs them) into a snapshot.
+        """
+        if self.version_index is not None:
+            names = tuple(name for name in names if name != 'get_repo_tags')
+        gathered = await asyncio.gather(*map(self._query, names))
+        results = {(name,): result for name, result in zip(names, gathered)}
+        tags = results.get(('get_tags',), ())
+        modified = results.get(('is_modified',))
+        if 'tip' in tags and not modified:
+            results['get_parent_tags', 'tip'] = await self._query(
+                'get_parent_tags', 'tip'
+            )
+        snapshot = Snapshot(_Resolver(self))
+        snapshot._results.update(results)
+        return snapshot
+
+    async def _resolve(self, name, *hooks, **kwargs):
+        snapshot = await self._snapshot(*hooks)
+        method = getattr(snapshot.repo, name)
+        return await asyncio.to_thread(method, snapshot=snapshot, **kwargs)
+
+    async def get_valid_versions(self):
+        """
+        Return all version tags that can be represented by a Version.
+        """
+        snapshot = await self._snapshot('get_repo_tags')
+        return await asyncio.to_thread(
+            lambda: list(snapshot.repo.get_valid_versions(snapshot))
+        )
+
+    async def get_tagged_version(self):
+        """
+        Get the version of the local working set as a Version or
+        None if no viable tag exists.
+        """
+        return await self._resolve('get_tagged_version', 'get_tags', 'is_modified')
+
+    async def get_latest_version(self):
+        """
+        Determine the latest version ever released of the project in
+        the repo (based on tags).
+        """
+        return await self._resolve('get_latest_version', 'get_repo_tags')
+
+    async def get_next_version(self, increment=None, series=None):
+        """
+        Return the next version based on prior tagged releases (in
+        series, if given).
+        """
+        return await self._resolve(
+            'get_next_version', 'get_repo_tags', increment=increment, series=series
+        )
+
+    async def get_current_version(self, increment=None, series=None):
+        """
+        Return as a string the version of the current state of the
+        repository, querying the tags of the working set and of the
+        repo concurrently.
+        """
+        return await self._resolve(
+            'get_current_version',
+            'get_tags',
+            'is_modified',
+            'get_repo_tags',
+            increment=increment,
+            series=series,
+        )
@@ -0,0 +1,205 @@
+"""
+Vectorized operations over many versions, held in a NumPy
+structured array with a zero-padded release matrix and columns
+for the epoch, release length and pre, post and dev segments
+(-1 where absent). Local versions are not supported.
+
+>>> versions = from_versions(['1.1', '3.0.9', '2.0rc1'])
+>>> list(map(str, to_versions(add(versions, '0.0.1'))))
+['1.1.1', '3.0.10', '2.0.1']
+>>> str(to_versions(versions)[argmax(versions)])
+'3.0.9'
+>>> argsort(versions).tolist()
+[0, 2, 1]
+"""
+
+import numpy as np
+import packaging.version
+
+from . import _phases, parse
+
+_absent = -1
+
+
+def dtype(width):
+    return np.dtype([
+        ('epoch', np.int64),
+        ('release', np.int64, (width,)),
+        ('length', np.int16),
+        ('pre_l', np.int8),
+        ('pre_n', np.int64),
+        ('post', np.int64),
+        ('dev', np.int64),
+    ])
+
+
+def _empty(count, width):
+    versions = np.zeros(count, dtype(width))
+    for field in 'pre_l', 'post', 'dev':
+        versions[field] = _absent
+    return versions
+
+
+def from_versions(versions, width=None):
+    """
+    Build an array from versions (Version objects or strings),
+    padding the release to width (default the longest).
+    """
+    versions = [
+        version
+        if isinstance(version, packaging.version.Version)
+        else parse(str(version))
+        for version in versions
+    ]
+    if width is None:
+        width = max((len(version.release) for version in versions), default=0)
+    result = _empty(len(versions), width)
+    for row, version in zip(result, versions):
+        if version.local is not None:
+            raise ValueError(f"Local versions are not supported: {version}")
+        row['epoch'] = version.epoch
+        row['release'][: len(version.release)] = version.release
+        row['length'] = len(version.release)
+        if version.pre is not None:
+            row['pre_l'] = _phases.index(version.pre[0])
+            row['pre_n'] = version.pre[1]
+        if version.post is not None:
+            row['post'] = version.post
+        if version.dev is not None:
+            row['dev'] = version.dev
+    return result
+
+
+def to_versions(versions):
+    """
+    Return the versions in the array as Version objects.
+    """
+    return [
+        packaging.version.Version.from_parts(
+            epoch=int(row['epoch']),
+            release=tuple(map(int, row['release'][: row['length']])),
+            pre=(_phases[row['pre_l']], int(row['pre_n']))
+            if row['pre_l'] != _absent
+            else None,
+            post=int(row['post']) if row['post'] != _absent else None,
+            dev=int(row['dev']) if row['dev'] != _absent else None,
+        )
+        for row in versions
+    ]
+
+
+def _as_array(versions):
+    if isinstance(versions, np.ndarray):
+        return versions
+    if isinstance(versions, (str, packaging.version.Version)):
+        versions = [versions]
+    return from_versions(versions)
+
+
+def _width(versions):
+    return versions.dtype['release'].shape[0]
+
+
+def _pad(versions, width):
+    if _width(versions) >= width:
+        return versions
+    result = np.zeros(versions.shape, dtype(width))
+    for field in versions.dtype.names:
+        if field != 'release':
+            result[field] = versions[field]
+    result['release'][..., : _width(versions)] = versions['release']
+    return result
+
+
+def add(versions, other):
+    """
+    Add other (an array or a single version) to each of versions, as
+    with :class:`jaraco.versioning.SummableVersion`: release components
+    are summed and other segments are dropped.
+    """
+    versions, other = _as_array(versions), _as_array(other)
+    width = max(_width(versions), _width(other))
+    versions, other = _pad(versions, width), _pad(other, width)
+    result = _empty(np.broadcast(versions, other).shape, width)
+    result['release'] = versions['release'] + other['release']
+    result['length'] = np.maximum(versions['length'], other['length'])
+    return result
+
+
+def reset_less_significant(versions, significant):
+    """
+    Return versions with all version info less significant than
+    significant (an array or a single version) reset to zero.
+
+    >>> versions = from_versions(['3.1.2', '1.2.3.4'])
+    >>> list(map(str, to_versions(reset_less_significant(versions, '0.1'))))
+    ['3.1', '1.2']
+    """
+    versions, significant = _as_array(versions), _as_array(significant)
+    width = max(_width(versions), _width(significant))
+    versions, significant = _pad(versions, width), _pad(significant, width)
+    columns = np.arange(width)
+    release = significant['release']
+    nonzero = release != 0
+    # one past the last nonzero component of significant
+    position = np.where(
+        nonzero.any(axis=-1), width - np.argmax(nonzero[..., ::-1], axis=-1), 0
+    )
+    result = np.array(
+        np.broadcast_to(versions, np.broadcast(versions, significant).shape)
+    )
+    result['release'] = np.where(
+        columns < position[..., np.newaxis], result['release'], 0
+    )
+    result['length'] = (
+        np.minimum(result['length'], position) + significant['length'] - position
+    )
+    return result
+
+
+def as_number(versions):
+    """
+    >>> np.round(as_number(from_versions(['1.9.3', '2'])), 12)
+    array([1.93, 2.  ])
+    """
+    return versions['release'] @ (10.0 ** -np.arange(_width(versions)))
+
+
+def _sort_keys(versions):
+    """
+    Yield the columns on which versions order, most significant first.
+    """
+    yield versions['epoch']
+    yield from versions['release'].T
+    pre_l, post, dev = versions['pre_l'], versions['post'], versions['dev']
+    # the phase, ranked as jaraco.versioning._phase_rank does
+    yield np.select(
+        [pre_l != _absent, (post == _absent) & (dev != _absent)],
+        [pre_l + 1, 0],
+        len(_phases) + 1,
+    )
+    yield versions['pre_n']
+    yield post
+    yield np.where(dev == _absent, np.iinfo(np.int64).max, dev)
+
+
+def argsort(versions):
+    """
+    Return the indices that would sort versions.
+    """
+    return np.lexsort(list(_sort_keys(versions))[::-1])
+
+
+def argmax(versions):
+    """
+    Return the index of the (first) greatest of versions.
+    """
+    if not len(versions):
+        raise ValueError("argmax of an empty sequence")
+    candidates = np.arange(len(versions))
+    for key in _sort_keys(versions):
+        values = key[candidates]
+        candidates = candidates[values == values.max()]
+        if len(candidates) == 1:
+            break
+    return int(candidates[0])
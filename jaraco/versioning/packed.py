@@ -0,0 +1,234 @@
+"""
+A compact binary format for large sets of versions, queried in
+place (such as through :mod:`mmap`) without building a Version
+for each entry.
+
+The layout (all integers unsigned) is:
+
+- a header: magic ``b'JVP1'``, count and release width (``<4sII``),
+- ``count`` fixed-width records,
+- an offset table of ``count`` record offsets (``<Q``) in version order,
+- the local version labels, referenced by the records.
+
+Each record begins with a sort key of big-endian integers (epoch,
+the release padded with zeros to the width, the pre-release phase and
+number, post and dev) whose bytes order as the versions do, followed
+by the length of the release and the position of the local label.
+
+>>> versions = PackedVersions(pack(['1.0', '2.0rc1', '1!0.1', '1.10', '2.0.dev1']))
+>>> len(versions)
+5
+>>> versions.min()
+<Version('1.0')>
+>>> versions.max()
+<Version('1!0.1')>
+>>> list(map(str, versions.sorted()))
+['1.0', '1.10', '2.0.dev1', '2.0rc1', '1!0.1']
+>>> list(map(str, versions.range('1.1', '2.0')))
+['1.10', '2.0.dev1', '2.0rc1']
+"""
+
+import mmap
+import struct
+
+import packaging.version
+
+from . import _local_segments, _phase_rank, _phases
+
+MAGIC = b'JVP1'
+_header = struct.Struct('<4sII')
+_offset = struct.Struct('<Q')
+_tail = struct.Struct('>BII')
+_none_dev = 2**64 - 1
+
+
+def _key_struct(width):
+    return struct.Struct(f'>{width + 1}QB3Q')
+
+
+def _encode_key(key_struct, width, version):
+    pre, post, dev = version.pre, version.post, version.dev
+    release = version.release + (0,) * (width - len(version.release))
+    return key_struct.pack(
+        version.epoch,
+        *release,
+        _phase_rank(pre, post, dev),
+        pre[1] if pre else 0,
+        0 if post is None else post + 1,
+        _none_dev if dev is None else dev,
+    )
+
+
+def _parse(version):
+    if isinstance(version, packaging.version.Version):
+        return version
+    return packaging.version.Version(str(version))
+
+
+def pack(versions):
+    """
+    Return versions (Version objects or strings) in the packed format.
+    Local labels must be ASCII.
+    """
+    versions = list(map(_parse, versions))
+    width = max((len(version.release) for version in versions), default=0)
+    key_struct = _key_struct(width)
+    record_size = key_struct.size + _tail.size
+    keys = [_encode_key(key_struct, width, version) for version in versions]
+    order = sorted(
+        range(len(versions)),
+        key=lambda index: (keys[index], _local_segments(versions[index].local)),
+    )
+    records_start = _header.size
+    locals_ = bytearray()
+    records = bytearray(_header.pack(MAGIC, len(versions), width))
+    for key, version in zip(keys, versions):
+        local = (version.local or '').encode('ascii')
+        records += key + _tail.pack(len(version.release), len(locals_), len(local))
+        locals_ += local
+    offsets = b''.join(
+        _offset.pack(records_start + record_size * index) for index in order
+    )
+    return bytes(records + offsets + locals_)
+
+
+def write(path, versions):
+    """
+    Write versions in the packed format to path.
+    """
+    with open(path, 'wb') as file:
+        file.write(pack(versions))
+
+
+class PackedVersions:
+    """
+    Versions in the packed format, queried directly on the buffer.
+    Versions are only built for the entries returned.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = memoryview(buffer)
+        magic, self._count, self._width = _header.unpack_from(self._buffer)
+        if magic != MAGIC:
+            raise ValueError(f"Not a packed version set: {bytes(magic)!r}")
+        self._key_struct = _key_struct(self._width)
+        self._record_size = self._key_struct.size + _tail.size
+        self._offsets_start = _header.size + self._record_size * self._count
+        self._locals_start = self._offsets_start + _offset.size * self._count
+
+    @classmethod
+    def open(cls, path):
+        """
+        Map the file at path into memory. Close the result to release it.
+        """
+        with open(path, 'rb') as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        packed = cls(mapped)
+        packed._mapped = mapped
+        return packed
+
+    def close(self):
+        self._buffer.release()
+        mapped = vars(self).pop('_mapped', None)
+        if mapped is not None:
+            mapped.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def _record(self, index):
+        return _header.size + self._record_size * index
+
+    def _ordered(self, position):
+        (offset,) = _offset.unpack_from(
+            self._buffer, self._offsets_start + _offset.size * position
+        )
+        return offset
+
+    def _local(self, offset):
+        _, start, length = _tail.unpack_from(
+            self._buffer, offset + self._key_struct.size
+        )
+        if not length:
+            return None
+        start += self._locals_start
+        return str(self._buffer[start : start + length], 'ascii')
+
+    def _sort_key(self, offset):
+        key = bytes(self._buffer[offset : offset + self._key_struct.size])
+        return key, _local_segments(self._local(offset))
+
+    def _bound_key(self, version):
+        version = _parse(version)
+        release = version.release
+        if any(release[self._width :]):
+            # beyond every version sharing the leading release components
+            head = self._key_struct.pack(
+                version.epoch, *release[: self._width], 0, 0, 0, 0
+            )
+            return head[: 8 * (self._width + 1)] + b'\xff' * 25, ()
+        version = version.__replace__(release=release[: self._width])
+        key = _encode_key(self._key_struct, self._width, version)
+        return key, _local_segments(version.local)
+
+    def _version(self, offset):
+        values = self._key_struct.unpack_from(self._buffer, offset)
+        epoch, release = values[0], values[1 : self._width + 1]
+        phase, pre, post, dev = values[self._width + 1 :]
+        length, _, _ = _tail.unpack_from(self._buffer, offset + self._key_struct.size)
+        return packaging.version.Version.from_parts(
+            epoch=epoch,
+            release=release[:length],
+            pre=(_phases[phase - 1], pre) if 0 < phase <= len(_phases) else None,
+            post=post - 1 if post else None,
+            dev=None if dev == _none_dev else dev,
+            local=self._local(offset),
+        )
+
+    def __iter__(self):
+        """
+        Yield the versions in the order they were packed.
+        """
+        return map(self._version, map(self._record, range(self._count)))
+
+    def sorted(self, reverse=False):
+        positions = range(self._count)
+        if reverse:
+            positions = reversed(positions)
+        return map(self._version, map(self._ordered, positions))
+
+    def min(self):
+        return self._version(self._ordered(0)) if self._count else None
+
+    def max(self):
+        return self._version(self._ordered(self._count - 1)) if self._count else None
+
+    def _bisect(self, key):
+        """
+        Return the position in version order of the first version
+        not less than key.
+        """
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._sort_key(self._ordered(mid)) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def range(self, lo=None, hi=None):
+        """
+        Yield, in order, the versions at least lo and less than hi.
+        """
+        if not self._count:
+            return iter(())
+        start = 0 if lo is None else self._bisect(self._bound_key(lo))
+        stop = self._count if hi is None else self._bisect(self._bound_key(hi))
+        return map(self._version, map(self._ordered, range(start, stop)))
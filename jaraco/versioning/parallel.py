@@ -0,0 +1,82 @@
+"""
+Version resolution across many repos at once, and parsing of
+large tag sets across many processes.
+"""
+
+import collections
+import concurrent.futures
+import os
+import time
+
+from . import _from_parts, _parts, parse_cache
+
+Resolution = collections.namedtuple('Resolution', 'repo version error elapsed')
+"""
+The outcome of resolving the version of repo: the version (or the
+exception raised, as error) and the seconds taken.
+"""
+
+
+def _resolve(repo, increment):
+    start = time.perf_counter()
+    try:
+        version, error = repo.get_current_version(increment), None
+    except Exception as exc:  # noqa: BLE001 -- reported with the repo
+        version, error = None, exc
+    return Resolution(repo, version, error, time.perf_counter() - start)
+
+
+def resolve_versions(repos, max_workers=None, increment=None):
+    """
+    Resolve the current version of each of repos (instances of
+    :class:`jaraco.versioning.Versioned`) in a pool of threads, yielding
+    a :data:`Resolution` for each as it completes.
+
+    Version resolution is dominated by waiting on the VCS, so
+    it parallelizes well across threads.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = [executor.submit(_resolve, repo, increment) for repo in repos]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+
+def _chunks(items, count):
+    size = -(-len(items) // count) or 1
+    return (items[start : start + size] for start in range(0, len(items), size))
+
+
+def _parse_chunk(tags):
+    return [_parts(version) for version in filter(None, map(parse_cache.lookup, tags))]
+
+
+def _latest_chunk(tags):
+    latest = max(filter(None, map(parse_cache.lookup, tags)), default=None)
+    return latest and _parts(latest)
+
+
+def _map_chunks(func, tags, max_workers):
+    max_workers = max_workers or os.cpu_count() or 1
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        return list(executor.map(func, _chunks(tags, max_workers)))
+
+
+def parse_versions(tags, max_workers=None):
+    """
+    Return the versions represented by tags (a list), parsed across
+    a pool of processes.
+
+    Workers return the components of each version rather than the
+    Version objects, as those are cheaper to transfer.
+    """
+    results = _map_chunks(_parse_chunk, tags, max_workers)
+    return [_from_parts(parts) for chunk in results for parts in chunk]
+
+
+def latest_version(tags, max_workers=None):
+    """
+    Return the latest version represented by tags (a list), or None,
+    with each of a pool of processes finding the latest in its share.
+    """
+    results = _map_chunks(_latest_chunk, tags, max_workers)
+    return max(map(_from_parts, filter(None, results)), default=None)
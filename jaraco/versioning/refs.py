@@ -0,0 +1,163 @@
+"""
+Read the tags of a local git repository straight from its refs
+(``packed-refs`` and ``refs/tags``), without running git.
+
+Only tags that might be versions (see
+:func:`jaraco.versioning.might_be_version`) are decoded; the rest
+are skipped while scanning the (memory-mapped) bytes of
+``packed-refs``.
+"""
+
+import collections
+import mmap
+import os
+import pathlib
+import re
+
+from . import (
+    Versioned,
+    _candidate_pattern,
+    latest_version,
+    might_be_version,
+    next_version,
+)
+
+Tag = collections.namedtuple('Tag', 'tag')
+
+_packed_tag = re.compile(
+    rb'^[0-9a-f]+ refs/tags/(%s)\r?$' % _candidate_pattern.encode('ascii'),
+    re.MULTILINE | re.IGNORECASE,
+)
+
+
+def _private_dir(path):
+    path = pathlib.Path(path)
+    found = path / '.git'
+    if found.is_file():
+        return path / found.read_text(encoding='utf-8').partition('gitdir:')[2].strip()
+    return found if found.is_dir() else path
+
+
+def git_dir(path):
+    """
+    Locate the git directory holding the refs for the repository
+    at path, following the ``.git`` file of a worktree or submodule
+    to the common directory. A path without ``.git`` is taken to be
+    a bare repository.
+    """
+    found = _private_dir(path)
+    common = found / 'commondir'
+    if common.is_file():
+        found = found / common.read_text(encoding='utf-8').strip()
+    return found
+
+
+def packed_tags(git_dir):
+    """
+    Return the names of version-like tags in the ``packed-refs``
+    of git_dir.
+
+    >>> packed_tags('/nonexistent')
+    []
+    """
+    try:
+        with open(os.path.join(git_dir, 'packed-refs'), 'rb') as file:
+            if not os.fstat(file.fileno()).st_size:
+                return []
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return [name.decode('ascii') for name in _packed_tag.findall(buffer)]
+    except FileNotFoundError:
+        return []
+
+
+def loose_tags(git_dir):
+    """
+    Return the names of version-like tags under ``refs/tags`` in
+    git_dir.
+
+    >>> loose_tags('/nonexistent')
+    []
+    """
+    try:
+        entries = os.scandir(os.path.join(git_dir, 'refs', 'tags'))
+    except FileNotFoundError:
+        return []
+    with entries:
+        return [
+            entry.name
+            for entry in entries
+            if might_be_version(entry.name) and entry.is_file()
+        ]
+
+
+def tags(path):
+    """
+    Return the names of version-like tags in the repository at path,
+    packed or loose, each once.
+    """
+    found = git_dir(path)
+    return list(dict.fromkeys(packed_tags(found) + loose_tags(found)))
+
+
+def _read(path):
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _mtime(path):
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def state_token(path):
+    """
+    Return a token of the state of the tags and HEAD of the repository
+    at path, which changes when a tag is added or removed or HEAD moves,
+    without running git. Modifications to the working tree are not
+    reflected.
+    """
+    private = _private_dir(path)
+    common = git_dir(path)
+    head = _read(private / 'HEAD')
+    branch = None
+    if head and head.startswith(b'ref: '):
+        branch = _read(common / head[5:].strip().decode('utf-8'))
+    return (
+        head,
+        branch,
+        _mtime(common / 'packed-refs'),
+        _mtime(common / 'refs' / 'tags'),
+    )
+
+
+def get_latest_version(path):
+    """
+    Return the latest version tagged in the repository at path, or None.
+    """
+    return latest_version(tags(path))
+
+
+def get_next_version(path, increment=Versioned.increment):
+    """
+    Return the next version for the repository at path.
+    """
+    return next_version(tags(path), increment)
+
+
+class RefsTags:
+    """
+    Mix into a git repo with a ``location`` (such as jaraco.vcs.Git)
+    ahead of :class:`jaraco.versioning.Versioned` to read the repo
+    tags from the refs rather than running git, and to retain the
+    versions until the refs or HEAD change (see :func:`state_token`).
+    """
+
+    def get_repo_tags(self):
+        return map(Tag, tags(self.location))
+
+    def get_state_token(self):
+        return state_token(self.location)
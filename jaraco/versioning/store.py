@@ -0,0 +1,83 @@
+"""
+Persistent storage of the versions parsed from a set of tags, so
+a fresh process needn't parse them again.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+
+from . import _from_parts, _parts, parse_cache
+
+
+def fingerprint(tags):
+    """
+    Compute a digest identifying the set of tags, regardless of order.
+
+    >>> fingerprint(['1.0', 'foo']) == fingerprint(['foo', '1.0'])
+    True
+    >>> fingerprint(['1.0']) == fingerprint(['1.0', 'foo'])
+    False
+    """
+    digest = hashlib.sha256()
+    for tag in sorted(set(tags)):
+        digest.update(tag.encode('utf-8') + b'\n')
+    return digest.hexdigest()
+
+
+class VersionStore:
+    """
+    A file retaining the versions parsed from the most recently
+    seen set of tags.
+    """
+
+    def __init__(self, path):
+        self.path = pathlib.Path(path)
+
+    def versions(self, tags):
+        """
+        Return the versions represented by tags, loading them from
+        the file if the tags are unchanged since they were stored.
+        """
+        tags = list(tags)
+        key = fingerprint(tags)
+        stored = self._load(key)
+        if stored is not None:
+            return stored
+        versions = list(filter(None, map(parse_cache.lookup, tags)))
+        self._save(key, versions)
+        return versions
+
+    def _load(self, key):
+        """
+        Return the stored versions if stored for key. The store being
+        unreadable or malformed is merely a miss.
+        """
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data['fingerprint'] != key:
+                return None
+            return list(map(_from_parts, data['versions']))
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return None
+
+    def _save(self, key, versions):
+        """
+        Store versions for key, replacing the file atomically. Failing
+        to store them (such as in an unwritable directory) is ignored.
+        """
+        data = dict(fingerprint=key, versions=list(map(_parts, versions)))
+        with contextlib.suppress(OSError):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=self.path.parent, delete=False
+            ) as tmp:
+                tmp.write(json.dumps(data))
+            try:
+                os.replace(tmp.name, self.path)
+            except OSError:
+                os.remove(tmp.name)
+                raise
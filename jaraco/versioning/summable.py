@@ -0,0 +1,45 @@
+import packaging.version
+
+from . import _add_releases, _as_number, _reset_release
+
+
+class SummableVersion(packaging.version.Version):
+    """
+    A special version that can be added to another Version.
+
+    >>> SummableVersion('1.1') + packaging.version.Version('2.3')
+    <SummableVersion('3.4')>
+
+    Construct one directly from its components (bypassing the parser)
+    with ``from_parts``.
+
+    >>> SummableVersion.from_parts(release=(1, 2))
+    <SummableVersion('1.2')>
+    """
+
+    __slots__ = ()
+
+    def __add__(self, other):
+        return SummableVersion.from_parts(
+            release=_add_releases(self.release, other.release)
+        )
+
+    def reset_less_significant(self, significant_version):
+        """
+        Reset to zero all version info less significant than the
+        indicated version.
+
+        >>> ver = SummableVersion('3.1.2')
+        >>> ver.reset_less_significant(SummableVersion('0.1'))
+        >>> str(ver)
+        '3.1'
+        """
+        new_release = _reset_release(self.release, significant_version.release)
+        self.__setstate__(self.__replace__(release=new_release).__getstate__())
+
+    def as_number(self):
+        """
+        >>> round(SummableVersion('1.9.3').as_number(), 12)
+        1.93
+        """
+        return _as_number(self.release)
@@ -0,0 +1,124 @@
+import asyncio
+import collections
+import threading
+import types
+
+import jaraco.versioning
+from jaraco.versioning import aio, store
+
+Tag = collections.namedtuple('Tag', 'tag')
+
+
+class Repo(aio.AsyncVersioned, types.SimpleNamespace):
+    pass
+
+
+def test_sync_hooks():
+    repo = Repo(
+        get_tags=lambda: ['foo'],
+        is_modified=lambda: False,
+        get_repo_tags=lambda: map(Tag, ['foo', '1.0', '1.1']),
+    )
+    assert asyncio.run(repo.get_current_version()) == '1.1.1.dev0'
+    assert asyncio.run(repo.get_current_version('minor')) == '1.2.dev0'
+
+
+def test_tagged_tip():
+    async def get_tags():
+        return ['tip']
+
+    async def get_parent_tags(rev):
+        return ['1.0']
+
+    async def is_modified():
+        return False
+
+    repo = Repo(
+        get_tags=get_tags,
+        get_parent_tags=get_parent_tags,
+        is_modified=is_modified,
+        get_repo_tags=list,
+    )
+    assert asyncio.run(repo.get_current_version()) == '1.0'
+
+
+def test_concurrent_hooks():
+    """
+    The hooks are queried concurrently, so each may wait on the others.
+    """
+
+    async def resolve():
+        pending = {'get_tags', 'is_modified', 'get_repo_tags'}
+        all_started = asyncio.Event()
+
+        async def started(name):
+            pending.discard(name)
+            if not pending:
+                all_started.set()
+            await all_started.wait()
+
+        async def get_tags():
+            await started('get_tags')
+            return []
+
+        async def is_modified():
+            await started('is_modified')
+            return False
+
+        async def get_repo_tags():
+            await started('get_repo_tags')
+            return [Tag('2.0')]
+
+        repo = Repo(
+            get_tags=get_tags, is_modified=is_modified, get_repo_tags=get_repo_tags
+        )
+        return await asyncio.wait_for(repo.get_current_version(), timeout=5)
+
+    assert asyncio.run(resolve()) == '2.0.1.dev0'
+
+
+def test_store_off_loop(tmp_path):
+    class Store(store.VersionStore):
+        def versions(self, tags):
+            assert threading.current_thread() is not threading.main_thread()
+            return super().versions(tags)
+
+    repo = Repo(
+        get_tags=list,
+        is_modified=lambda: False,
+        get_repo_tags=lambda: map(Tag, ['1.0', 'foo']),
+        version_store=Store(tmp_path / 'versions.json'),
+    )
+    assert asyncio.run(repo.get_current_version()) == '1.0.1.dev0'
+
+
+def test_parse_off_loop(monkeypatch):
+    lookup = jaraco.versioning.parse_cache.lookup
+
+    def off_loop(*args, **kwargs):
+        assert threading.current_thread() is not threading.main_thread()
+        return lookup(*args, **kwargs)
+
+    monkeypatch.setattr(jaraco.versioning.parse_cache, 'lookup', off_loop)
+    repo = Repo(
+        get_tags=lambda: ['tip'],
+        get_parent_tags=lambda rev: ['2.0'],
+        is_modified=lambda: True,
+        get_repo_tags=lambda: map(Tag, ['1.0', '2.0', 'foo']),
+    )
+    assert asyncio.run(repo.get_current_version()) == '2.0.1.dev0'
+    versions = asyncio.run(repo.get_valid_versions())
+    assert list(map(str, versions)) == ['1.0', '2.0']
+
+
+def test_series_and_observer():
+    repo = Repo(
+        get_tags=list,
+        is_modified=lambda: False,
+        get_repo_tags=lambda: map(Tag, ['1.0', '1.1', '2.0']),
+        observer=jaraco.versioning.Timings(),
+    )
+    assert asyncio.run(repo.get_current_version(series='1')) == '1.1.1.dev0'
+    assert str(asyncio.run(repo.get_next_version('minor'))) == '2.1'
+    assert {'get_tags', 'get_repo_tags', 'parse'} <= set(repo.observer.durations)
+    assert repo.observer.tallies['tags'] == 6
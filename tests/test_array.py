@@ -0,0 +1,69 @@
+import random
+
+import packaging.version
+import pytest
+
+from jaraco.versioning import SummableVersion
+
+np = pytest.importorskip('numpy')
+array = pytest.importorskip('jaraco.versioning.array')
+
+samples = [
+    '0.1',
+    '1.0',
+    '1.0.0',
+    '1.0.post1',
+    '1.0.dev0',
+    '1.0a1',
+    '1.0a1.dev2',
+    '1.0b2.post3',
+    '1.0rc1',
+    '1.0.1',
+    '1.10',
+    '2.0.0.0.1',
+    '1!0.1',
+]
+
+
+def test_round_trip():
+    assert list(map(str, array.to_versions(array.from_versions(samples)))) == samples
+
+
+@pytest.mark.parametrize('increment', ['0.0.1', '0.1', '1', '0.0.0.1'])
+def test_add_and_reset(increment):
+    versions = array.from_versions(samples)
+    summed = array.reset_less_significant(array.add(versions, increment), increment)
+    expected = []
+    for sample in samples:
+        version = SummableVersion(sample) + SummableVersion(increment)
+        version.reset_less_significant(SummableVersion(increment))
+        expected.append(str(version))
+    assert list(map(str, array.to_versions(summed))) == expected
+
+
+def test_reset_pairwise():
+    versions = array.from_versions(['3.1.2', '3.1.2', '3.1.2rc1'])
+    significant = array.from_versions(['0.1', '1', '0.0.0.1'])
+    result = array.reset_less_significant(versions, significant)
+    assert list(map(str, array.to_versions(result))) == ['3.1', '3', '3.1.2rc1']
+
+
+def test_as_number():
+    numbers = array.as_number(array.from_versions(samples))
+    expected = [SummableVersion(sample).as_number() for sample in samples]
+    np.testing.assert_allclose(numbers, expected)
+
+
+def test_ordering():
+    shuffled = list(samples)
+    random.Random(0).shuffle(shuffled)
+    versions = array.from_versions(shuffled)
+    parsed = list(map(packaging.version.Version, shuffled))
+    ordered = [parsed[index] for index in array.argsort(versions)]
+    assert ordered == sorted(parsed)
+    assert parsed[array.argmax(versions)] == max(parsed)
+
+
+def test_local_unsupported():
+    with pytest.raises(ValueError):
+        array.from_versions(['1.0+local'])
@@ -0,0 +1,39 @@
+"""
+Importing jaraco.versioning should be cheap, as it's used by short-lived
+processes (such as hooks and shell prompts).
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+budget_ms = 25
+
+
+def run(code, tmp_path, *options):
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=str(tmp_path))
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    cmd = [sys.executable, *options, '-c', code]
+    return subprocess.run(
+        cmd, env=env, capture_output=True, text=True, check=True, encoding='utf-8'
+    )
+
+
+def test_packaging_deferred(tmp_path):
+    code = 'import sys, jaraco.versioning; print("packaging" in sys.modules)'
+    assert run(code, tmp_path).stdout.strip() == 'False'
+
+
+def import_time_ms(tmp_path):
+    stderr = run('import jaraco.versioning', tmp_path, '-X', 'importtime').stderr
+    (cumulative,) = re.findall(
+        r'\|\s*(\d+) \| jaraco\.versioning$', stderr, re.MULTILINE
+    )
+    return int(cumulative) / 1000
+
+
+def test_import_budget(tmp_path):
+    # write bytecode, then take the best of several runs to reduce noise
+    run('import jaraco.versioning', tmp_path)
+    assert min(import_time_ms(tmp_path) for _ in range(5)) < budget_ms
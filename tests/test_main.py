@@ -0,0 +1,65 @@
+import socket
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from jaraco.versioning import __main__ as cli
+
+tags = 'foo\n1.0\n1.1rc1\n1.1\n'
+
+
+def run(*args, input=tags):
+    cmd = [sys.executable, '-m', 'jaraco.versioning', *args]
+    proc = subprocess.run(
+        cmd, input=input, capture_output=True, text=True, check=True, encoding='utf-8'
+    )
+    return proc.stdout.strip()
+
+
+def test_commands(tmp_path):
+    assert run('latest') == '1.1'
+    assert run('next', '--increment', 'minor') == '1.2'
+    assert run('current') == '1.1.1.dev0'
+    assert run('current', '--tagged', 'foo 1.0') == '1.0'
+    assert run('semver', '1.2', input='') == 'v1.2.0'
+    path = tmp_path / 'tags.txt'
+    path.write_text(tags, encoding='utf-8')
+    assert run('--tags', str(path), 'latest', input='') == '1.1'
+
+
+def request(path, text):
+    with socket.socket(socket.AF_UNIX) as client:
+        client.connect(str(path))
+        client.sendall(text.encode('utf-8'))
+        client.shutdown(socket.SHUT_WR)
+        return client.makefile(encoding='utf-8').read()
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="Unix sockets required")
+def test_serve(tmp_path):
+    path = tmp_path / 'sock'
+    with cli.make_server(str(path)) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            assert request(path, 'next --increment major\n' + tags) == '2\n'
+            assert request(path, 'latest\n' + tags) == '1.1\n'
+            assert request(path, 'bogus\n').startswith('error: ')
+        finally:
+            server.shutdown()
+            thread.join()
+
+
+def test_serve_replaces_only_sockets(tmp_path):
+    path = tmp_path / 'sock'
+    path.write_text('precious', encoding='utf-8')
+    with pytest.raises(FileExistsError):
+        cli.make_server(str(path))
+    assert path.read_text(encoding='utf-8') == 'precious'
+
+    path.unlink()
+    cli.make_server(str(path)).server_close()
+    with cli.make_server(str(path)):
+        pass
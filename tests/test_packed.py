@@ -0,0 +1,73 @@
+import random
+
+import packaging.version
+import pytest
+
+from jaraco.versioning import packed
+
+samples = [
+    '0.1',
+    '1.0',
+    '1.0.0',
+    '1.0.post1',
+    '1.0.dev0',
+    '1.0a1',
+    '1.0a1.dev2',
+    '1.0b2.post3',
+    '1.0rc1',
+    '1.0+local',
+    '1.0+local.7',
+    '1.0+2',
+    '1.0.1',
+    '1.10',
+    '2.0.0.0.1',
+    '1!0.1',
+    '20230101.1',
+]
+
+
+@pytest.fixture
+def versions():
+    shuffled = list(samples)
+    random.Random(0).shuffle(shuffled)
+    return list(map(packaging.version.Version, shuffled))
+
+
+def test_mapped(tmp_path, versions):
+    path = tmp_path / 'versions.bin'
+    packed.write(path, versions)
+    with packed.PackedVersions.open(path) as loaded:
+        assert list(loaded) == versions
+        assert list(map(str, loaded)) == list(map(str, versions))
+        assert list(loaded.sorted()) == sorted(versions)
+        assert list(loaded.sorted(reverse=True)) == sorted(versions, reverse=True)
+        assert loaded.min() == min(versions)
+        assert loaded.max() == max(versions)
+
+
+@pytest.mark.parametrize(
+    'lo,hi',
+    [
+        ('1.0', '1.1'),
+        ('1.0a1', '1.0+local'),
+        (None, '1.0'),
+        ('2.0.0.0.0.1', None),
+        ('1.0.0.0.0.0.1', '2.0.0.0.1.0.0'),
+    ],
+)
+def test_range(versions, lo, hi):
+    loaded = packed.PackedVersions(packed.pack(versions))
+    expected = sorted(
+        version
+        for version in versions
+        if (lo is None or version >= packaging.version.Version(lo))
+        and (hi is None or version < packaging.version.Version(hi))
+    )
+    assert list(loaded.range(lo, hi)) == expected
+
+
+def test_empty():
+    loaded = packed.PackedVersions(packed.pack([]))
+    assert len(loaded) == 0
+    assert loaded.max() is None
+    assert list(loaded.range('1.0', '2.0')) == []
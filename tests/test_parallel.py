@@ -0,0 +1,57 @@
+import collections
+import threading
+import types
+
+from jaraco import versioning
+from jaraco.versioning import parallel
+
+Tag = collections.namedtuple('Tag', 'tag')
+
+
+class Repo(versioning.Versioned, types.SimpleNamespace):
+    def is_modified(self):
+        return False
+
+
+def test_resolve_versions():
+    def fail():
+        raise RuntimeError("unreachable")
+
+    good = Repo(get_tags=list, get_repo_tags=lambda: [Tag('1.0')])
+    bad = Repo(get_tags=fail)
+    results = {
+        result.repo is good: result for result in parallel.resolve_versions([good, bad])
+    }
+    assert results[True].version == '1.0.1.dev0'
+    assert results[True].error is None
+    assert isinstance(results[False].error, RuntimeError)
+    assert all(result.elapsed >= 0 for result in results.values())
+
+
+def test_concurrent():
+    """
+    Repos are resolved concurrently, so each may wait on the others.
+    """
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get_tags():
+        barrier.wait()
+        return ['1.0']
+
+    repos = [Repo(get_tags=get_tags) for _ in range(3)]
+    results = parallel.resolve_versions(repos, max_workers=3)
+    assert [result.version for result in results] == ['1.0'] * 3
+
+
+def test_parallel_parsing():
+    tags = ['foo', '1.0', '3.0rc1', '2.0', 'bar', '1!0.1', '2.1']
+    repo = Repo(
+        get_tags=list,
+        get_repo_tags=lambda: map(Tag, tags),
+        parallel_threshold=3,
+    )
+    expected = ['1.0', '3.0rc1', '2.0', '1!0.1', '2.1']
+    assert list(map(str, repo.get_valid_versions())) == expected
+    assert str(repo.get_latest_version()) == '1!0.1'
+    assert parallel.parse_versions(['foo'], max_workers=2) == []
+    assert parallel.latest_version(['foo', 'bar'], max_workers=2) is None
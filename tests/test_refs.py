@@ -0,0 +1,106 @@
+import shutil
+import subprocess
+
+import packaging.version
+import pytest
+
+from jaraco import versioning
+from jaraco.versioning import Versioned, refs
+
+sha = '0123456789abcdef0123456789abcdef01234567'
+
+packed = f"""\
+# pack-refs with: peeled fully-peeled sorted
+{sha} refs/heads/main
+{sha} refs/heads/1.9
+{sha} refs/tags/1.0
+^{sha}
+{sha} refs/tags/v1.1
+{sha} refs/tags/backup/2.0
+{sha} refs/tags/foo
+{sha} refs/tags/1.2rc1
+"""
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git = tmp_path / '.git'
+    (git / 'refs' / 'tags' / 'release').mkdir(parents=True)
+    (git / 'packed-refs').write_text(packed, encoding='utf-8')
+    (git / 'refs' / 'tags' / '1.0').write_text(sha + '\n', encoding='utf-8')
+    (git / 'refs' / 'tags' / '0.9').write_text(sha + '\n', encoding='utf-8')
+    (git / 'refs' / 'tags' / 'tip').write_text(sha + '\n', encoding='utf-8')
+    (git / 'refs' / 'tags' / 'release' / '3.0').write_text(sha + '\n', encoding='utf-8')
+    return tmp_path
+
+
+def test_tags(repo):
+    assert refs.tags(repo) == ['1.0', 'v1.1', '1.2rc1', '0.9']
+
+
+def test_empty(tmp_path):
+    (tmp_path / 'packed-refs').write_bytes(b'')
+    assert refs.tags(tmp_path) == []
+    assert refs.get_latest_version(tmp_path) is None
+
+
+def test_worktree(repo, tmp_path):
+    worktree = tmp_path / 'worktree'
+    private = repo / '.git' / 'worktrees' / 'worktree'
+    private.mkdir(parents=True)
+    (private / 'commondir').write_text('../..\n', encoding='utf-8')
+    worktree.mkdir()
+    (worktree / '.git').write_text(f'gitdir: {private}\n', encoding='utf-8')
+    assert refs.get_latest_version(worktree) == packaging.version.Version('1.2rc1')
+
+
+def test_next_version(repo):
+    assert str(refs.get_next_version(repo, 'minor')) == '1.2'
+
+
+def test_versioned(repo):
+    class Repo(refs.RefsTags, Versioned):
+        location = repo
+
+    assert str(Repo().get_latest_version()) == '1.2rc1'
+
+
+@pytest.mark.skipif(not shutil.which('git'), reason="git not available")
+def test_git(tmp_path, monkeypatch):
+    for var in 'AUTHOR', 'COMMITTER':
+        monkeypatch.setenv(f'GIT_{var}_NAME', 'x')
+        monkeypatch.setenv(f'GIT_{var}_EMAIL', 'x@example.com')
+
+    def git(*args):
+        subprocess.run(['git', '-C', str(tmp_path), *args], check=True)
+
+    git('init', '-q')
+    git('commit', '-q', '--allow-empty', '-m', 'x')
+    for tag in ('1.0', '1.1', 'foo'):
+        git('tag', tag)
+    git('pack-refs', '--all')
+    token = refs.state_token(tmp_path)
+    assert refs.state_token(tmp_path) == token
+    git('tag', '-a', '-m', 'x', '2.0')
+    assert sorted(refs.tags(tmp_path)) == ['1.0', '1.1', '2.0']
+    assert refs.state_token(tmp_path) != token
+    token = refs.state_token(tmp_path)
+    git('commit', '-q', '--allow-empty', '-m', 'y')
+    assert refs.state_token(tmp_path) != token
+
+
+def test_packed_matches_prefilter(tmp_path):
+    names = [
+        '1.0',
+        'v2',
+        'V3.0rc1',
+        '1!2.0+local',
+        'tip',
+        'backup/2.0',
+        'x1.0',
+        '1.0_a',
+    ]
+    refs_text = ''.join(f'{sha} refs/tags/{name}\n' for name in names)
+    (tmp_path / 'packed-refs').write_text(refs_text, encoding='utf-8')
+    expected = list(filter(versioning.might_be_version, names))
+    assert refs.packed_tags(tmp_path) == expected
@@ -0,0 +1,83 @@
+import collections
+import concurrent.futures
+import types
+
+import packaging.version
+import pytest
+
+from jaraco import versioning
+from jaraco.versioning import store
+
+
+class Versioned(versioning.Versioned, types.SimpleNamespace):
+    def is_modified(self):
+        return False
+
+
+Tag = collections.namedtuple('Tag', 'tag')
+
+
+def test_versions_stored(tmp_path, monkeypatch):
+    path = tmp_path / 'versions.json'
+    tags = ['foo', '1.0', '2.0rc1']
+    repo = Versioned(
+        get_tags=lambda rev=None: set(),
+        get_repo_tags=lambda: map(Tag, tags),
+        version_store=store.VersionStore(path),
+    )
+    assert repo.get_current_version() == '2.0.dev0'
+    assert path.exists()
+
+    # a fresh process loads the versions without parsing
+    monkeypatch.setattr(versioning, 'parse_cache', None)
+    monkeypatch.setattr(store, 'parse_cache', None)
+    repo.version_store = store.VersionStore(path)
+    assert repo.get_latest_version() == packaging.version.Version('2.0rc1')
+
+
+def test_tags_changed(tmp_path):
+    versions = store.VersionStore(tmp_path / 'versions.json')
+    assert list(map(str, versions.versions(['1.0']))) == ['1.0']
+    assert list(map(str, versions.versions(['1.0', '1.1']))) == ['1.0', '1.1']
+
+
+def test_corrupt(tmp_path):
+    path = tmp_path / 'versions.json'
+    path.write_text('garbage', encoding='utf-8')
+    assert list(map(str, store.VersionStore(path).versions(['1.0']))) == ['1.0']
+
+
+@pytest.mark.parametrize(
+    'content',
+    [
+        '[1, 2]',
+        '"text"',
+        '{"versions": []}',
+        '{"fingerprint": "%s", "versions": [[0, [1], null, null, null]]}',
+        '{"fingerprint": "%s", "versions": [[0, 1, 2, 3, 4, 5]]}',
+        '{"fingerprint": "%s", "versions": 3}',
+    ],
+)
+def test_malformed(tmp_path, content):
+    path = tmp_path / 'versions.json'
+    content = content.replace('%s', store.fingerprint(['1.0']))
+    path.write_text(content, encoding='utf-8')
+    assert list(map(str, store.VersionStore(path).versions(['1.0']))) == ['1.0']
+
+
+def test_unwritable(tmp_path):
+    path = tmp_path / 'file' / 'versions.json'
+    (tmp_path / 'file').write_text('not a directory', encoding='utf-8')
+    assert list(map(str, store.VersionStore(path).versions(['1.0']))) == ['1.0']
+
+
+def test_concurrent_writers(tmp_path):
+    path = tmp_path / 'versions.json'
+    tags = [f'1.{n}' for n in range(100)]
+
+    def resolve(n):
+        return len(store.VersionStore(path).versions(tags[: n % 10 + 90]))
+
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        assert len(list(executor.map(resolve, range(50)))) == 50
+    assert [p.name for p in tmp_path.iterdir()] == ['versions.json']
@@ -1,10 +1,14 @@
 import collections
+import random
 import types
 
 import packaging.version
+import pytest
 
 from jaraco import versioning
 
+Tag = collections.namedtuple('Tag', 'tag')
+
 
 class Versioned(versioning.Versioned, types.SimpleNamespace):
     def is_modified(self):
@@ -63,3 +67,319 @@ class TestVersioning:
         assert mgr.get_tagged_version() is None
         assert mgr.get_next_version() == packaging.version.Version('1.0.1')
         assert mgr.get_current_version() == '1.0.1.dev0'
+
+    def test_parse_cache(self):
+        """
+        Repeated resolution should parse each tag only once.
+        """
+        versioning.parse_cache.clear()
+        mgr = Versioned(
+            get_tags=lambda rev=None: {'foo', '1.0'},
+            get_repo_tags=lambda: set(),
+        )
+        mgr.get_current_version()
+        mgr.get_current_version()
+        info = versioning.parse_cache.info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_parse_cache_new_tags_when_full(self, monkeypatch):
+        """
+        Tags created after the cache fills are still cached.
+        """
+        monkeypatch.setattr(versioning, 'parse_cache', versioning.ParseCache(100))
+        for n in range(100):
+            versioning.parse_cache.lookup(f'0.{n}')
+        tags = [Tag('1.0')]
+        mgr = Versioned(get_repo_tags=lambda: tags)
+        mgr.get_latest_version()
+        tags.append(Tag('2.0'))
+        assert mgr.get_latest_version() == packaging.version.Version('2.0')
+        info = versioning.parse_cache.info()
+        assert info.hits == 1
+        assert mgr.get_latest_version() == packaging.version.Version('2.0')
+        info = versioning.parse_cache.info()
+        assert info.hits == 3
+        assert info.currsize == 100
+
+    def test_parse_cache_default_size(self):
+        assert versioning.ParseCache().maxsize == 2**18
+
+    def test_version_index(self):
+        """
+        With an index, the repo tags are not rescanned.
+        """
+        mgr = Versioned(
+            get_tags=lambda rev=None: set(),
+            version_index=versioning.VersionIndex(['foo', '1.0']),
+        )
+        assert mgr.get_next_version() == packaging.version.Version('1.0.1')
+        mgr.version_index.add_tags(['1.1'])
+        assert mgr.get_latest_version() == packaging.version.Version('1.1')
+        assert mgr.get_current_version() == '1.1.1.dev0'
+
+
+def test_infer_next_versions_matches_single():
+    pairs = [
+        (last, increment)
+        for last in [None, '3.2', '3.1.2', '3.0.9', '3.1a1', '1!2.0']
+        for increment in ['major', 'minor', 'patch', '0.1', '1.0']
+    ]
+    pairs.append((None, '1.x'))
+    infer = versioning.Versioned.infer_next_version
+    expected = [str(infer(*pair)) for pair in pairs]
+    batch = versioning.Versioned.infer_next_versions(iter(pairs))
+    assert list(map(str, batch)) == expected
+
+
+class TestQueries:
+    @pytest.fixture
+    def mgr(self):
+        tags = ['foo', '1.0', '2.0', '2.3.1', '2.3.4', '2.4rc1', '3.0', '2.30']
+        return Versioned(
+            get_repo_tags=lambda: map(Tag, tags),
+        )
+
+    def test_latest_versions(self, mgr):
+        assert list(map(str, mgr.get_latest_versions(3))) == ['3.0', '2.30', '2.4rc1']
+        assert len(mgr.get_latest_versions(100)) == 7
+
+    def test_latest_in_series(self, mgr):
+        assert str(mgr.get_latest_in_series('2.3')) == '2.3.4'
+        assert str(mgr.get_latest_in_series('2')) == '2.30'
+        assert mgr.get_latest_in_series('4') is None
+
+    def test_between(self, mgr):
+        between = mgr.iter_versions_between('2.0', '2.5')
+        assert list(map(str, between)) == ['2.0', '2.3.1', '2.3.4', '2.4rc1']
+        assert list(map(str, mgr.iter_versions_between(hi='2.0'))) == ['1.0']
+
+    def test_version_set(self, mgr):
+        versions = mgr.get_version_set()
+        previous = {str(ver): str(versions.latest_before(ver)) for ver in versions}
+        assert previous == {
+            '1.0': 'None',
+            '2.0': '1.0',
+            '2.3.1': '2.0',
+            '2.3.4': '2.3.1',
+            '2.4rc1': '2.3.4',
+            '2.30': '2.4rc1',
+            '3.0': '2.30',
+        }
+        assert str(versions.ceiling('2.4')) == '2.30'
+        assert str(versions.floor('2.4')) == '2.4rc1'
+        assert versions.latest is max(versions)
+
+    def test_series_heads(self, mgr):
+        heads = mgr.get_series_heads()
+        assert {key: str(head) for key, head in heads.items()} == {
+            (1, 0): '1.0',
+            (2, 0): '2.0',
+            (2, 3): '2.3.4',
+            (2, 4): '2.4rc1',
+            (2, 30): '2.30',
+            (3, 0): '3.0',
+        }
+        for key, head in heads.items():
+            assert mgr.get_latest_in_series(key) == head
+        assert str(mgr.get_series_heads(1)[2,]) == '2.30'
+        heads.add_tags(['2.3.10'])
+        assert str(heads[2, 3]) == '2.3.10'
+
+    def test_next_in_series(self, mgr):
+        assert str(mgr.get_next_version(series='2.3')) == '2.3.5'
+        assert str(mgr.get_next_version('minor', series='2')) == '2.31'
+        assert mgr.get_next_version(series='2.5') == '2.5'
+        mgr.get_tags = list
+        assert mgr.get_current_version(series='1.0') == '1.0.1.dev0'
+
+    def test_latest_in_series_indexed(self, mgr):
+        tags = [tag.tag for tag in mgr.get_repo_tags()]
+        tags += ['1!2.3.9', '2.3.4.post1', '2.3.5.dev0', '2.2.1+local', '1!0.1']
+        indexed = Versioned(version_index=versioning.VersionIndex(tags))
+        scanned = Versioned(get_repo_tags=lambda: map(Tag, tags))
+        for series in ['1', '2', '2.2', '2.3', '2.3.5', '2.4', '0', '0.1', '3', '4']:
+            expected = scanned.get_latest_in_series(series)
+            assert indexed.get_latest_in_series(series) == expected, series
+
+    def test_queries_indexed(self, mgr):
+        tags = [tag.tag for tag in mgr.get_repo_tags()]
+        indexed = Versioned(version_index=versioning.VersionIndex(tags))
+        for k in [0, 3, 100]:
+            assert indexed.get_latest_versions(k) == mgr.get_latest_versions(k)
+        for lo, hi in [('2.0', '2.5'), (None, '2.0'), ('2.3.2', None), ('4', None)]:
+            expected = sorted(mgr.iter_versions_between(lo, hi))
+            assert list(indexed.iter_versions_between(lo, hi)) == expected
+
+
+def test_snapshot_queries_once():
+    calls = collections.Counter()
+
+    def hook(name, result):
+        def query(*args):
+            calls[name] += 1
+            return result
+
+        return query
+
+    mgr = Versioned(
+        get_tags=hook('get_tags', ['tip']),
+        is_modified=hook('is_modified', False),
+        get_parent_tags=hook('get_parent_tags', ['foo']),
+        get_repo_tags=hook('get_repo_tags', [Tag('1.0')]),
+    )
+    snapshot = mgr.snapshot()
+    assert mgr.get_current_version('patch', snapshot=snapshot) == '1.0.1.dev0'
+    assert mgr.get_current_version('minor', snapshot=snapshot) == '1.1.dev0'
+    assert mgr.get_latest_version(snapshot) == packaging.version.Version('1.0')
+    assert set(calls.values()) == {1}
+    assert len(calls) == 4
+
+
+def test_timings():
+    mgr = Versioned(
+        get_tags=lambda: ['foo'],
+        get_repo_tags=lambda: map(Tag, ['foo', 'bar', '1.0', '1.x']),
+        observer=versioning.Timings(),
+    )
+    assert mgr.get_current_version() == '1.0.1.dev0'
+    timings = mgr.observer
+    assert timings.counts == dict(
+        get_tags=1, get_repo_tags=1, parse=2, select=2, infer=1
+    )
+    assert timings.tallies == dict(tags=5, rejected=4)
+    assert set(timings.durations) == set(timings.counts)
+
+
+def test_streaming_lines(tmp_path):
+    path = tmp_path / 'tags'
+    path.write_bytes(b'foo\n1.0\n\n  1.1  \nbackup/2023-01\n')
+    with path.open('rb') as lines:
+        assert versioning.latest_version(lines) == packaging.version.Version('1.1')
+    with path.open(encoding='utf-8') as lines:
+        assert str(versioning.next_version(lines)) == '1.1.1'
+    assert versioning.latest_version(iter(())) is None
+
+
+def test_sort_key_orders_as_versions():
+    rand = random.Random(0)
+
+    def component():
+        return str(rand.choice([0, 1, 2, 10, 255, 256, 70000]))
+
+    def generate():
+        text = '.'.join(component() for _ in range(rand.randint(1, 4)))
+        if rand.random() < 0.2:
+            text = f'{rand.randint(0, 2)}!{text}'
+        if rand.random() < 0.3:
+            text += rand.choice(['a', 'b', 'rc']) + component()
+        if rand.random() < 0.3:
+            text += '.post' + component()
+        if rand.random() < 0.3:
+            text += '.dev' + component()
+        if rand.random() < 0.2:
+            text += '+' + rand.choice(['abc', 'abc.1', '1', 'ABD', '2.x', 'abc-0'])
+        return packaging.version.Version(text)
+
+    versions = [generate() for _ in range(2000)]
+    by_key = sorted(versions, key=versioning.sort_key)
+    assert by_key == sorted(versions)
+    for left, right in zip(by_key, by_key[1:]):
+        assert (left == right) == (
+            versioning.sort_key(left) == versioning.sort_key(right)
+        )
+
+
+def test_state_token_memoization():
+    calls = collections.Counter()
+    tags = ['1.0']
+
+    def get_repo_tags():
+        calls['get_repo_tags'] += 1
+        return map(Tag, tags)
+
+    mgr = Versioned(
+        get_tags=list,
+        get_repo_tags=get_repo_tags,
+        get_state_token=lambda: len(tags),
+    )
+    assert mgr.get_current_version() == '1.0.1.dev0'
+    assert mgr.get_current_version() == '1.0.1.dev0'
+    assert mgr.get_current_version('minor') == '1.1.dev0'
+    assert mgr.get_current_version(increment='minor') == '1.1.dev0'
+    assert mgr.get_latest_version() == packaging.version.Version('1.0')
+    assert mgr.get_latest_version() == packaging.version.Version('1.0')
+    assert calls['get_repo_tags'] == 3
+    tags.append('2.0')
+    assert mgr.get_current_version() == '2.0.1.dev0'
+    assert calls['get_repo_tags'] == 4
+    mgr.get_latest_version(mgr.snapshot())
+    assert calls['get_repo_tags'] == 5
+    assert mgr.get_current_version(series=[1, 0]) == '1.0.1.dev0'
+
+
+def test_state_token_once_per_query():
+    calls = collections.Counter()
+
+    def get_state_token():
+        calls['get_state_token'] += 1
+        return 'token'
+
+    mgr = Versioned(
+        get_tags=list,
+        get_repo_tags=lambda: [Tag('1.0')],
+        get_state_token=get_state_token,
+    )
+    assert mgr.get_current_version() == '1.0.1.dev0'
+    assert calls['get_state_token'] == 1
+
+
+def test_no_state_token():
+    calls = collections.Counter()
+
+    def get_repo_tags():
+        calls['get_repo_tags'] += 1
+        return [Tag('1.0')]
+
+    mgr = Versioned(get_repo_tags=get_repo_tags)
+    mgr.get_latest_version()
+    mgr.get_latest_version()
+    assert calls['get_repo_tags'] == 2
+
+
+def test_overrides_without_snapshot():
+    """
+    Subclasses overriding the queries with their former signatures
+    still resolve the current version.
+    """
+
+    class Legacy(Versioned):
+        def get_tagged_version(self):
+            return None
+
+        def get_next_version(self, increment=None):
+            return super().get_next_version(increment)
+
+        def get_latest_version(self):
+            return packaging.version.Version('2.0')
+
+    assert Legacy().get_current_version() == '2.0.1.dev0'
+
+    class LegacyValid(Versioned):
+        def get_valid_versions(self):
+            return iter(map(packaging.version.Version, ['1.0', '2.3.1', '2.0']))
+
+    repo = LegacyValid(get_tags=list)
+    assert str(repo.get_latest_version()) == '2.3.1'
+    assert repo.get_current_version() == '2.3.2.dev0'
+    assert str(repo.get_next_version(series='2.0')) == '2.0.1'
+    assert str(repo.get_latest_in_series('1')) == '1.0'
+    assert len(repo.get_version_set()) == 3
+    assert len(repo.get_series_heads()) == 3
+
+
+def test_summable_version_slots():
+    version = versioning.SummableVersion('3.1.2')
+    assert not hasattr(version, '__dict__')
+    version.reset_less_significant(versioning.SummableVersion('0.1'))
+    assert version == versioning.SummableVersion('3.1')